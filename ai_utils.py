@@ -288,6 +288,14 @@ def resolve_ticker_name(ticker: str):
 
 def generate_market_behavior_analysis(ticker, winning_strategy, mr_sharpe, mom_sharpe, mr_params, mom_params, mr_dd=None, mom_dd=None):
     """Use AI to generate intelligent market behavior analysis based on strategy performance."""
+    analysis = _request_market_behavior_analysis(ticker, winning_strategy, mr_sharpe, mom_sharpe, mr_params, mom_params, mr_dd, mom_dd)
+    if analysis is None:
+        # Fallback to rule-based analysis
+        return get_fallback_market_analysis(ticker, winning_strategy)
+    return analysis
+
+def _request_market_behavior_analysis(ticker, winning_strategy, mr_sharpe, mom_sharpe, mr_params, mom_params, mr_dd=None, mom_dd=None):
+    """Ask Gemini for the market behavior analysis; returns None when no AI answer is available."""
     try:
         import requests
         import json
@@ -296,7 +304,7 @@ def generate_market_behavior_analysis(ticker, winning_strategy, mr_sharpe, mom_s
         # Check for API key
         api_key = os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
         if not api_key:
-            return get_fallback_market_analysis(ticker, winning_strategy)
+            return None
         
         url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
         
@@ -347,8 +355,27 @@ def generate_market_behavior_analysis(ticker, winning_strategy, mr_sharpe, mom_s
     except Exception as e:
         print(f"AI market analysis failed: {e}")
     
-    # Fallback to rule-based analysis
-    return get_fallback_market_analysis(ticker, winning_strategy)
+    return None
+
+# AI answers keyed by the analysis inputs, oldest first; failed requests are never stored
+_market_analysis_cache = {}
+_MARKET_ANALYSIS_CACHE_SIZE = 64
+
+def cached_market_behavior_analysis(ticker, winning_strategy, mr_sharpe, mom_sharpe, mr_params, mom_params, mr_dd=None, mom_dd=None):
+    """Memoized generate_market_behavior_analysis: reports on the same results reuse the first AI answer."""
+    # mr_params may arrive as a list; the cache key must be hashable
+    mr_params = tuple(mr_params) if mr_params is not None else None
+    key = (ticker, winning_strategy, mr_sharpe, mom_sharpe, mr_params, mom_params, mr_dd, mom_dd)
+    analysis = _market_analysis_cache.get(key)
+    if analysis is None:
+        analysis = _request_market_behavior_analysis(*key)
+        if analysis is None:
+            # Not cached, so the next report retries the request
+            return get_fallback_market_analysis(ticker, winning_strategy)
+        _market_analysis_cache[key] = analysis
+        if len(_market_analysis_cache) > _MARKET_ANALYSIS_CACHE_SIZE:
+            del _market_analysis_cache[next(iter(_market_analysis_cache))]
+    return analysis
 
 def get_fallback_market_analysis(ticker, winning_strategy):
     """Fallback market behavior analysis when AI is unavailable."""
@@ -17,7 +17,7 @@ def parse_ticker_argument():
         print("WARNING: No ticker specified. Using default BTC-USD. Usage: python main.py <TICKER>")
         return ticker
 
-def download_ticker_data(ticker, start_date=None, end_date=None):
+def download_ticker_data(ticker, start_date=None, end_date=None, cache_dir='.cache'):
     """
     Download historical data for a given ticker with error handling.
     
@@ -25,6 +25,7 @@ def download_ticker_data(ticker, start_date=None, end_date=None):
     - ticker: Stock ticker symbol
     - start_date: Start date for historical data (default: 1 year ago)
     - end_date: End date for historical data (default: today)
+    - cache_dir: Directory for cached downloads keyed by (ticker, start, end); None disables it
     
     Returns:
     - pd.DataFrame: Historical price data
@@ -34,6 +35,29 @@ def download_ticker_data(ticker, start_date=None, end_date=None):
         end_date = datetime.now().strftime('%Y-%m-%d')
     if start_date is None:
         start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+    
+    # Reuse an earlier download of the same range instead of going back to the network
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, f"{ticker}_{start_date}_{end_date}.pkl")
+        try:
+            data = pd.read_pickle(cache_path)
+        except FileNotFoundError:
+            data = None
+        except Exception:
+            # Truncated file, or a pickle from another pandas version or code base: treat it
+            # like a miss and let the download below replace it
+            data = False
+        
+        if isinstance(data, pd.DataFrame) and not data.empty:
+            print(f"Loaded {len(data)} days of cached data for {ticker} ({start_date} to {end_date})")
+            return data
+        if data is not None:
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass  # Best effort; a successful download overwrites it anyway
+    
     print(f"Downloading data for {ticker}...")
     
     try:
@@ -47,6 +71,13 @@ def download_ticker_data(ticker, start_date=None, end_date=None):
             sys.exit(1)
             
         print(f"Successfully downloaded {len(data)} days of data for {ticker} ({start_date} to {end_date})")
+        
+        if cache_path is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                data.to_pickle(cache_path)
+            except OSError:
+                pass  # Caching is best effort; the download itself succeeded
         return data
         
     except Exception as e:
@@ -1,6 +1,5 @@
 import yfinance as yf
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 
 def simulate_portfolio(data, strategy_name, ticker='TSLA', initial_cash=100):
@@ -25,33 +24,51 @@ def simulate_portfolio(data, strategy_name, ticker='TSLA', initial_cash=100):
         elif f'{ticker}_Close' in data.columns:
             data[f'Close_{ticker}'] = data[f'{ticker}_Close']
 
-    cash = initial_cash
-    position = 0
-    in_market = False
-    portfolio_values = []
+    price = data[f'Close_{ticker}'].to_numpy(dtype=np.float64)
+    signal = data['Position'].to_numpy(dtype=np.float64)
+    data['PortfolioValue'] = _simulate_positions(price, signal, initial_cash)
+    return data
+
+def _simulate_positions(price, signal, initial_cash):
+    """
+    Portfolio value of a long/flat strategy, computed on plain arrays.
     
-    for idx, row in data.iterrows():
-        price = row[f'Close_{ticker}']
-        signal = row['Position']
-        
-        if not in_market:
-            if signal == 1:
-                position = cash / price
-                cash = 0
-                in_market = True
-        else:
-            if signal == 1:
-                pass  # Already in market
-            elif signal == -1:
-                cash = position * price
-                position = 0
-                in_market = False
+    Parameters:
+    - price: 1-D float64 array of close prices
+    - signal: 1-D array of position changes (1 = buy, -1 = sell, anything else = hold)
+    - initial_cash: Starting cash amount
+    
+    Returns:
+    - 1-D float64 array of portfolio values, one per price
+    """
+    buys = np.flatnonzero(signal == 1)
+    sells = np.flatnonzero(signal == -1)
+    
+    # Long/flat state machine walked trade by trade: enter on the first buy signal
+    # while flat, exit on the first sell signal after that. While flat the value is
+    # the cash held; while long it is the shares bought at entry marked to market.
+    portfolio_values = np.empty(len(price))
+    cash = initial_cash
+    start = 0
+    while True:
+        k = np.searchsorted(buys, start)
+        if k == len(buys):
+            portfolio_values[start:] = cash
+            break
+        entry = buys[k]
+        portfolio_values[start:entry] = cash
+        shares = cash / price[entry]
         
-        portfolio_value = cash + (position * price)
-        portfolio_values.append(portfolio_value)
+        j = np.searchsorted(sells, entry, side='right')
+        if j == len(sells):
+            portfolio_values[entry:] = shares * price[entry:]
+            break
+        exit_ = sells[j]
+        portfolio_values[entry:exit_ + 1] = shares * price[entry:exit_ + 1]
+        cash = shares * price[exit_]
+        start = exit_ + 1
     
-    data['PortfolioValue'] = portfolio_values
-    return data
+    return portfolio_values
 
 def get_current_risk_free_rate():
     """
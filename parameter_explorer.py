@@ -3,20 +3,136 @@ import numpy as np
 import strategies
 import finance_utils
 
+# Column dtypes for the scalar fields of exploration results
+_RESULT_DTYPES = {'Window': np.int64, 'Threshold': np.float64, 'Sharpe_Ratio': np.float64, 'Max_Drawdown': np.float64}
+
+def results_to_arrays(results, columns):
+    """
+    Extract scalar fields of exploration results into typed NumPy arrays.
+    
+    Parameters:
+    - results: List of result dicts as returned by the explore_* methods
+    - columns: Scalar fields to extract (e.g. ['Window', 'Sharpe_Ratio'])
+    
+    Returns:
+    - dict mapping each field to a 1-D array in result order; None values become NaN
+    """
+    count = len(results)
+    return {
+        column: np.fromiter((np.nan if r[column] is None else r[column] for r in results),
+                            dtype=_RESULT_DTYPES[column], count=count)
+        for column in columns
+    }
+
+def results_to_frame(results, columns):
+    """
+    Build a DataFrame from exploration results one typed NumPy column at a time.
+    
+    Parameters:
+    - results: List of result dicts as returned by the explore_* methods
+    - columns: Scalar fields to extract (e.g. ['Window', 'Sharpe_Ratio'])
+    
+    Returns:
+    - pd.DataFrame with one column per field; None values become NaN
+    """
+    return pd.DataFrame(results_to_arrays(results, columns))
+
+def _backtest_mean_reversion(data, ticker, window, threshold, rolling_mean, signal, risk_free_rate):
+    """Run and score one mean reversion parameter combination; returns (test_data, sharpe, drawdown_metrics)."""
+    test_data = strategies.mean_reversion_strategy(
+        data, 
+        window=window, 
+        threshold=threshold, 
+        ticker=ticker,
+        rolling_mean=rolling_mean,
+        signal=signal
+    )
+    test_data = finance_utils.simulate_portfolio(
+        test_data, 
+        f"Mean Reversion (W={window}, T={threshold})", 
+        ticker=ticker
+    )
+    return (test_data,
+            finance_utils.calculate_sharpe_ratio(test_data, risk_free_rate),
+            finance_utils.calculate_max_drawdown(test_data))
+
+def _backtest_momentum(data, ticker, window, rolling_mean, risk_free_rate):
+    """Run and score one momentum window; returns (test_data, sharpe, drawdown_metrics)."""
+    test_data = strategies.simple_momentum_strategy(
+        data, 
+        window=window, 
+        ticker=ticker,
+        rolling_mean=rolling_mean
+    )
+    test_data = finance_utils.simulate_portfolio(
+        test_data, 
+        f"Momentum (W={window})", 
+        ticker=ticker
+    )
+    return (test_data,
+            finance_utils.calculate_sharpe_ratio(test_data, risk_free_rate),
+            finance_utils.calculate_max_drawdown(test_data))
+
+def _run_backtests(backtest, jobs, max_workers):
+    """
+    Yield backtest(*job) for every job, in order, as each result becomes available.
+    
+    Jobs are independent, so with max_workers > 1 they are spread over worker processes;
+    otherwise (the default) they run serially in this process.
+    """
+    if not max_workers or max_workers <= 1:
+        for job in jobs:
+            yield backtest(*job)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    
+    # Same spawn context as report_generator.generate_reports_parallel: workers start
+    # from a clean interpreter rather than a fork of the caller's state
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        yield from executor.map(backtest, *zip(*jobs))
+
 class ParameterExplorer:
     """Class to handle parameter exploration and optimization for trading strategies."""
     
     def __init__(self, data, ticker):
         self.data = data
         self.ticker = ticker
+        # Per-window shifted rolling means and the (rate, source) risk-free rate, computed
+        # once and shared by every strategy run on this data
+        self._rolling_means = {}
+        self._close_cumsum = None
+        self._risk_free = None
+    
+    def _rolling_mean(self, window):
+        """Return the shifted rolling mean of the close for window, or None if there is no close column."""
+        if window not in self._rolling_means:
+            close_col = f'Close_{self.ticker}'
+            if close_col not in self.data.columns:
+                return None
+            close = self.data[close_col]
+            # One prefix-sum array serves every window size
+            if self._close_cumsum is None:
+                self._close_cumsum = strategies.close_prefix_sums(close)
+            self._rolling_means[window] = strategies.shifted_rolling_mean_series(close, window, self._close_cumsum)
+        return self._rolling_means[window]
+    
+    def _risk_free_rate(self):
+        """Return (rate, source), fetching the current risk-free rate on first use only."""
+        if self._risk_free is None:
+            self._risk_free = finance_utils.get_current_risk_free_rate()
+        return self._risk_free
         
-    def explore_mean_reversion_parameters(self, windows=None, thresholds=None):
+    def explore_mean_reversion_parameters(self, windows=None, thresholds=None, max_workers=None):
         """
         Explore different parameter combinations for mean reversion strategy.
         
         Parameters:
         - windows: List of window sizes to test (default: [10, 20, 30, 50])
         - thresholds: List of threshold values to test (default: [0.01, 0.02, 0.03, 0.05])
+        - max_workers: Number of worker processes to spread combinations over (default: serial)
         
         Returns:
         - tuple: (results_list, best_params, best_sharpe)
@@ -26,60 +142,95 @@ class ParameterExplorer:
         if thresholds is None:
             thresholds = [0.01, 0.02, 0.03, 0.05]
             
+        print("Exploring mean reversion parameters...")
+        return self._evaluate_mean_reversion(
+            [(window, threshold) for window in windows for threshold in thresholds], max_workers)
+    
+    def random_search_mean_reversion_parameters(self, n_samples=8, window_range=(10, 50),
+                                               threshold_range=(0.005, 0.05), seed=None, max_workers=None):
+        """
+        Search mean reversion parameters by sampling the same box the grid covers at random.
+        
+        Parameters:
+        - n_samples: Number of (window, threshold) combinations to test (default: 8)
+        - window_range: Inclusive (min, max) window size, sampled uniformly (default: (10, 50))
+        - threshold_range: (min, max) threshold, sampled log-uniformly (default: (0.005, 0.05))
+        - seed: Seed for reproducible sampling (default: None)
+        - max_workers: Number of worker processes to spread combinations over (default: serial)
+        
+        Returns:
+        - tuple: (results_list, best_params, best_sharpe), in the same format as
+          explore_mean_reversion_parameters
+        """
+        rng = np.random.default_rng(seed)
+        windows = rng.integers(window_range[0], window_range[1], size=n_samples, endpoint=True)
+        log_low, log_high = np.log(threshold_range)
+        thresholds = np.exp(rng.uniform(log_low, log_high, size=n_samples))
+        
+        print("Random search over mean reversion parameters...")
+        return self._evaluate_mean_reversion(list(zip(windows.tolist(), thresholds.tolist())), max_workers)
+    
+    def _evaluate_mean_reversion(self, combinations, max_workers):
+        """
+        Backtest mean reversion (window, threshold) combinations and rank them by Sharpe ratio.
+        
+        Parameters:
+        - combinations: List of (window, threshold) pairs, in the order results are returned
+        - max_workers: Number of worker processes to spread combinations over (None: serial)
+        
+        Returns:
+        - tuple: (results_list, best_params, best_sharpe)
+        """
         results = []
         best_sharpe = -np.inf
         best_params = None
+        risk_free_rate = self._risk_free_rate()[0]
         
-        print("Exploring mean reversion parameters...")
-        total_combinations = len(windows) * len(thresholds)
-        current_combination = 0
+        # Signals for every threshold of a window in one batch, one row per threshold
+        thresholds_by_window = {}
+        for window, threshold in combinations:
+            thresholds_by_window.setdefault(window, []).append(threshold)
+        signals = {}
+        for window, thresholds in thresholds_by_window.items():
+            rolling_mean = self._rolling_mean(window)
+            if rolling_mean is not None:
+                rows = strategies.mean_reversion_signals(self.data[f'Close_{self.ticker}'], rolling_mean, thresholds)
+            else:
+                rows = [None] * len(thresholds)
+            signals.update(((window, threshold), row) for threshold, row in zip(thresholds, rows))
         
-        for window in windows:
-            for threshold in thresholds:
-                current_combination += 1
-                print(f"Testing combination {current_combination}/{total_combinations}: Window={window}, Threshold={threshold:.3f}")
-                
-                # Apply mean reversion strategy with current parameters
-                test_data = strategies.mean_reversion_strategy(
-                    self.data.copy(), 
-                    window=window, 
-                    threshold=threshold, 
-                    ticker=self.ticker
-                )
-                
-                # Simulate portfolio
-                test_data = finance_utils.simulate_portfolio(
-                    test_data, 
-                    f"Mean Reversion (W={window}, T={threshold})", 
-                    ticker=self.ticker
-                )
-                
-                # Calculate Sharpe ratio and drawdown
-                sharpe = finance_utils.calculate_sharpe_ratio(test_data)
-                drawdown_metrics = finance_utils.calculate_max_drawdown(test_data)
-                
-                # Store results
-                results.append({
-                    'Window': window,
-                    'Threshold': threshold,
-                    'Sharpe_Ratio': sharpe if sharpe is not None else np.nan,
-                    'Max_Drawdown': drawdown_metrics['max_drawdown'],
-                    'Data': test_data
-                })
-                
-                # Track best parameters
-                if sharpe is not None and sharpe > best_sharpe:
-                    best_sharpe = sharpe
-                    best_params = (window, threshold)
+        jobs = [(self.data, self.ticker, window, threshold, self._rolling_mean(window),
+                 signals[(window, threshold)], risk_free_rate)
+                for window, threshold in combinations]
+        
+        backtests = _run_backtests(_backtest_mean_reversion, jobs, max_workers)
+        
+        for i, ((_, _, window, threshold, _, _, _), (test_data, sharpe, drawdown_metrics)) in enumerate(zip(jobs, backtests), 1):
+            print(f"Tested combination {i}/{len(jobs)}: Window={window}, Threshold={threshold:.3f}")
+            
+            # Store results
+            results.append({
+                'Window': window,
+                'Threshold': threshold,
+                'Sharpe_Ratio': sharpe if sharpe is not None else np.nan,
+                'Max_Drawdown': drawdown_metrics['max_drawdown'],
+                'Data': test_data
+            })
+            
+            # Track best parameters
+            if sharpe is not None and sharpe > best_sharpe:
+                best_sharpe = sharpe
+                best_params = (window, threshold)
         
         return results, best_params, best_sharpe
     
-    def explore_momentum_parameters(self, windows=None):
+    def explore_momentum_parameters(self, windows=None, max_workers=None):
         """
         Explore different parameter combinations for momentum strategy.
         
         Parameters:
         - windows: List of window sizes to test (default: [10, 20, 30, 50])
+        - max_workers: Number of worker processes to spread windows over (default: serial)
         
         Returns:
         - tuple: (results_list, best_params, best_sharpe)
@@ -92,27 +243,14 @@ class ParameterExplorer:
         best_params = None
         
         print("Exploring momentum parameters...")
+        risk_free_rate = self._risk_free_rate()[0]
         
-        for i, window in enumerate(windows, 1):
-            print(f"Testing momentum window {i}/{len(windows)}: Window={window}")
-            
-            # Apply momentum strategy with current parameters
-            test_data = strategies.simple_momentum_strategy(
-                self.data.copy(), 
-                window=window, 
-                ticker=self.ticker
-            )
-            
-            # Simulate portfolio
-            test_data = finance_utils.simulate_portfolio(
-                test_data, 
-                f"Momentum (W={window})", 
-                ticker=self.ticker
-            )
-            
-            # Calculate Sharpe ratio and drawdown
-            sharpe = finance_utils.calculate_sharpe_ratio(test_data)
-            drawdown_metrics = finance_utils.calculate_max_drawdown(test_data)
+        jobs = [(self.data, self.ticker, window, self._rolling_mean(window), risk_free_rate) for window in windows]
+        
+        backtests = _run_backtests(_backtest_momentum, jobs, max_workers)
+        
+        for i, ((_, _, window, _, _), (test_data, sharpe, drawdown_metrics)) in enumerate(zip(jobs, backtests), 1):
+            print(f"Tested momentum window {i}/{len(jobs)}: Window={window}")
             
             # Store results
             results.append({
@@ -131,10 +269,7 @@ class ParameterExplorer:
     
     def display_mean_reversion_results(self, results, best_params, best_sharpe):
         """Display mean reversion parameter exploration results."""
-        results_df = pd.DataFrame([
-            {'Window': r['Window'], 'Threshold': r['Threshold'], 'Sharpe_Ratio': r['Sharpe_Ratio'], 'Max_Drawdown': r['Max_Drawdown']} 
-            for r in results
-        ])
+        results_df = results_to_frame(results, ['Window', 'Threshold', 'Sharpe_Ratio', 'Max_Drawdown'])
         
         print("\n" + "="*70)
         print("MEAN REVERSION STRATEGY - PERFORMANCE RESULTS")
@@ -159,17 +294,17 @@ class ParameterExplorer:
     
     def display_momentum_results(self, results, best_params, best_sharpe):
         """Display momentum parameter exploration results."""
-        results_df = pd.DataFrame([
-            {'Window': r['Window'], 'Sharpe_Ratio': r['Sharpe_Ratio'], 'Max_Drawdown': r['Max_Drawdown']} 
-            for r in results
-        ])
+        results_df = results_to_frame(results, ['Window', 'Sharpe_Ratio', 'Max_Drawdown'])
         
         print("\n" + "="*60)
         print("MOMENTUM STRATEGY - PERFORMANCE RESULTS")
         print("="*60)
         print("SHARPE RATIO & MAX DRAWDOWN:")
         display_df = results_df.set_index('Window')[['Sharpe_Ratio', 'Max_Drawdown']].round(4)
-        display_df['Max_Drawdown'] = display_df['Max_Drawdown'].apply(lambda x: f"{x:.2%}" if pd.notna(x) else "N/A")
+        # Format the whole column at once rather than calling a lambda per row
+        drawdowns = display_df['Max_Drawdown'].to_numpy(dtype=np.float64)
+        display_df['Max_Drawdown'] = np.where(np.isnan(drawdowns), 'N/A',
+                                              np.char.add(np.char.mod('%.2f', drawdowns * 100), '%'))
         print(display_df.to_string())
         
         # Display best parameter combination with drawdown
@@ -264,14 +399,18 @@ class ParameterExplorer:
         print("STRATEGY PERFORMANCE RESULTS")
         print("="*50)
         
+        risk_free_rate, source = self._risk_free_rate()
+        print(f"Risk-free rate: {risk_free_rate:.3%} (Source: {source})")
+        
         # Strategy 1: Momentum Strategy
         momentum_data = strategies.simple_momentum_strategy(
-            self.data.copy(), window=momentum_window, ticker=self.ticker
+            self.data, window=momentum_window, ticker=self.ticker,
+            rolling_mean=self._rolling_mean(momentum_window)
         )
         momentum_data = finance_utils.simulate_portfolio(
             momentum_data, f"Momentum (W={momentum_window})", ticker=self.ticker
         )
-        momentum_sharpe = finance_utils.calculate_sharpe_ratio(momentum_data, print_rate_info=True)
+        momentum_sharpe = finance_utils.calculate_sharpe_ratio(momentum_data, risk_free_rate)
         momentum_drawdown = finance_utils.calculate_max_drawdown(momentum_data)
         print(f"Momentum Strategy:")
         print(f"   Sharpe Ratio: {momentum_sharpe:.4f}" if momentum_sharpe else "   Sharpe Ratio: Unable to calculate")
@@ -279,12 +418,13 @@ class ParameterExplorer:
 
         # Strategy 2: Mean Reversion Strategy  
         mean_reversion_data = strategies.mean_reversion_strategy(
-            self.data.copy(), window=mr_window, threshold=mr_threshold, ticker=self.ticker
+            self.data, window=mr_window, threshold=mr_threshold, ticker=self.ticker,
+            rolling_mean=self._rolling_mean(mr_window)
         )
         mean_reversion_data = finance_utils.simulate_portfolio(
             mean_reversion_data, f"Mean Reversion (W={mr_window}, T={mr_threshold:.3f})", ticker=self.ticker
         )
-        mean_reversion_sharpe = finance_utils.calculate_sharpe_ratio(mean_reversion_data)
+        mean_reversion_sharpe = finance_utils.calculate_sharpe_ratio(mean_reversion_data, risk_free_rate)
         mean_reversion_drawdown = finance_utils.calculate_max_drawdown(mean_reversion_data)
         print(f"Mean Reversion Strategy:")
         print(f"   Sharpe Ratio: {mean_reversion_sharpe:.4f}" if mean_reversion_sharpe else "   Sharpe Ratio: Unable to calculate")
@@ -10,11 +10,7 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak,
 from reportlab.lib.colors import black, blue, green, red, grey
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from datetime import datetime
-import matplotlib.pyplot as plt
-import io
-import base64
-import pandas as pd
-import tempfile
+import numpy as np
 import os
 
 class ProfessionalReportGenerator:
@@ -98,15 +94,21 @@ class ProfessionalReportGenerator:
                               rightMargin=2*cm, leftMargin=2*cm,
                               topMargin=2*cm, bottomMargin=2*cm)
         
+        # Index the results once so every section looks up the best rows in O(1)
+        mr_by_key = {(r['Window'], r['Threshold']): r for r in mr_results}
+        mom_by_window = {r['Window']: r for r in mom_results}
+        
         # Build content
         content = []
         
         # Page 1: Executive Summary
-        content.extend(self._create_executive_summary(mr_results, mom_results, mr_best_params, mom_best_params))
+        content.extend(self._create_executive_summary(mr_results, mom_results, mr_best_params, mom_best_params,
+                                                      mr_by_key, mom_by_window))
         content.append(PageBreak())
         
         # Page 2: Strategy Performance
-        content.extend(self._create_performance_analysis(mr_results, mom_results, mr_best_params, mom_best_params))
+        content.extend(self._create_performance_analysis(mr_results, mom_results, mr_best_params, mom_best_params,
+                                                         mr_by_key, mom_by_window))
         content.append(PageBreak())
         
         # Page 3: Parameter Analysis
@@ -114,7 +116,8 @@ class ProfessionalReportGenerator:
         content.append(PageBreak())
         
         # Page 4: AI Market Insights
-        content.extend(self._create_market_insights(mr_results, mom_results, mr_best_params, mom_best_params))
+        content.extend(self._create_market_insights(mr_results, mom_results, mr_best_params, mom_best_params,
+                                                    mr_by_key, mom_by_window))
         content.append(PageBreak())
         
         # Page 5: Glossary
@@ -124,7 +127,8 @@ class ProfessionalReportGenerator:
         doc.build(content)
         return filename
     
-    def _create_executive_summary(self, mr_results, mom_results, mr_best_params, mom_best_params):
+    def _create_executive_summary(self, mr_results, mom_results, mr_best_params, mom_best_params,
+                                  mr_by_key, mom_by_window):
         """Create executive summary page."""
         content = []
         
@@ -139,8 +143,8 @@ class ProfessionalReportGenerator:
         content.append(Spacer(1, 20))
         
         if mr_best_params and mom_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             
             # Mean Reversion Results
             content.append(Paragraph("Mean Reversion Strategy", self.styles['SectionHeader']))
@@ -191,15 +195,16 @@ class ProfessionalReportGenerator:
         
         return content
     
-    def _create_performance_analysis(self, mr_results, mom_results, mr_best_params, mom_best_params):
+    def _create_performance_analysis(self, mr_results, mom_results, mr_best_params, mom_best_params,
+                                     mr_by_key, mom_by_window):
         """Create performance analysis with embedded charts."""
         content = []
         
         content.append(Paragraph("Strategy Performance Analysis", self.styles['CustomTitle']))
         
         if mr_best_params and mom_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             
             # Performance comparison table
             content.append(Paragraph("Performance Summary", self.styles['SectionHeader']))
@@ -249,6 +254,7 @@ class ProfessionalReportGenerator:
     
     def _create_parameter_analysis(self, mr_results, mom_results, mr_best_params, mom_best_params):
         """Create parameter sensitivity analysis."""
+        import parameter_explorer
         content = []
         
         content.append(Paragraph("Parameter Optimization Results", self.styles['CustomTitle']))
@@ -258,9 +264,10 @@ class ProfessionalReportGenerator:
             content.append(Paragraph("Mean Reversion Parameter Sensitivity", self.styles['SectionHeader']))
             
             # Create summary statistics
-            mr_df = pd.DataFrame(mr_results)
-            best_window = mr_df.groupby('Window')['Sharpe_Ratio'].max().idxmax()
-            best_threshold = mr_df.groupby('Threshold')['Sharpe_Ratio'].max().idxmax()
+            mr_df = parameter_explorer.results_to_frame(mr_results, ['Window', 'Threshold', 'Sharpe_Ratio'])
+            sharpes = mr_df['Sharpe_Ratio'].to_numpy()
+            best_window = self._best_group(mr_df['Window'].to_numpy(), sharpes)
+            best_threshold = self._best_group(mr_df['Threshold'].to_numpy(), sharpes)
             
             mr_analysis = f"""
             <b>Optimal Parameters:</b> Window={mr_best_params[0]} days, Threshold={mr_best_params[1]:.1%}<br/>
@@ -276,7 +283,7 @@ class ProfessionalReportGenerator:
         if mom_results:
             content.append(Paragraph("Momentum Parameter Sensitivity", self.styles['SectionHeader']))
             
-            mom_df = pd.DataFrame(mom_results)
+            mom_df = parameter_explorer.results_to_frame(mom_results, ['Window', 'Sharpe_Ratio'])
             
             mom_analysis = f"""
             <b>Optimal Parameter:</b> Window={mom_best_params} days<br/>
@@ -288,15 +295,24 @@ class ProfessionalReportGenerator:
         
         return content
     
-    def _create_market_insights(self, mr_results, mom_results, mr_best_params, mom_best_params):
+    @staticmethod
+    def _best_group(keys, values):
+        """Return the key whose group holds the highest value, ignoring NaN."""
+        uniq, idx = np.unique(keys, return_inverse=True)
+        group_max = np.full(uniq.size, -np.inf)
+        np.fmax.at(group_max, idx, values)
+        return uniq[np.argmax(group_max)]
+    
+    def _create_market_insights(self, mr_results, mom_results, mr_best_params, mom_best_params,
+                                mr_by_key, mom_by_window):
         """Create AI-powered market insights page."""
         content = []
         
         content.append(Paragraph(f"Market Behavior Analysis - {self.ticker}", self.styles['CustomTitle']))
         
         if mr_best_params and mom_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             winning_strategy = "Mean Reversion" if best_mr['Sharpe_Ratio'] > best_mom['Sharpe_Ratio'] else "Momentum"
             
             # Strategy comparison
@@ -323,7 +339,7 @@ class ProfessionalReportGenerator:
             
             try:
                 import ai_utils
-                ai_analysis = ai_utils.generate_market_behavior_analysis(
+                ai_analysis = ai_utils.cached_market_behavior_analysis(
                     self.ticker, winning_strategy, 
                     best_mr['Sharpe_Ratio'], best_mom['Sharpe_Ratio'],
                     mr_best_params, mom_best_params,
@@ -418,13 +434,14 @@ def prompt_for_professional_report_generation(report_type, results=None, mr_resu
             
             print(f"Professional PDF report generated: {filename}")
             
-            # Check if file was created and show file size
-            if os.path.exists(filename):
-                file_size = os.path.getsize(filename) / 1024  # Size in KB
+            # Check if file was created and show file size (one stat call)
+            try:
+                file_size = os.stat(filename).st_size / 1024  # Size in KB
+            except FileNotFoundError:
+                print("ERROR: Report file was not created")
+            else:
                 print(f"Report saved successfully ({file_size:.1f} KB)")
                 print("Features: Professional layout, consistent A4 formatting, no matplotlib boxes")
-            else:
-                print("ERROR: Report file was not created")
                 
     except (EOFError, KeyboardInterrupt):
         print("\nSkipping professional report generation.")
@@ -1,4 +1,8 @@
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 import numpy as np
 
 class StrategyPlotter:
@@ -33,26 +37,41 @@ class StrategyPlotter:
         sharpe_display = f"{sharpe:.3f}" if sharpe is not None else "N/A"
         drawdown_display = f"{max_drawdown:.2%}" if max_drawdown is not None else "N/A"
         
-        # Plot price and rolling mean
-        ax.plot(test_data.index, test_data[f'Close_{self.ticker}'], 
-               label=f'{self.ticker} Price', linewidth=1, color='gray')
-        ax.plot(test_data.index, test_data['RollingMean'], 
-               label='Rolling Mean', linewidth=1, color='blue')
+        # Price, rolling mean and band edges share one LineCollection instead of one
+        # Line2D per curve; Line2D proxies carry the legend entries
+        dates = mdates.date2num(test_data.index)
+        close = test_data[f'Close_{self.ticker}'].to_numpy()
+        rolling_mean = test_data['RollingMean'].to_numpy()
+        has_mean = ~np.isnan(rolling_mean)
+        
+        segments = [np.column_stack([dates, close]),
+                    np.column_stack([dates[has_mean], rolling_mean[has_mean]])]
+        colors = ['gray', 'blue']
+        linewidths = [1, 1]
+        legend_proxies = [Line2D([], [], linewidth=1, color='gray', label=f'{self.ticker} Price'),
+                          Line2D([], [], linewidth=1, color='blue', label='Rolling Mean')]
         
         # Add threshold bands for mean reversion
         if threshold is not None:
-            upper_band = test_data['RollingMean'] * (1 + threshold)
-            lower_band = test_data['RollingMean'] * (1 - threshold)
-            ax.fill_between(test_data.index, upper_band, lower_band, 
+            upper_band = rolling_mean * (1 + threshold)
+            lower_band = rolling_mean * (1 - threshold)
+            ax.fill_between(dates, upper_band, lower_band, 
                            alpha=0.3, color='red', label='Threshold Bands')
-            ax.plot(test_data.index, upper_band, linewidth=0.8, color='red', alpha=0.7)
-            ax.plot(test_data.index, lower_band, linewidth=0.8, color='red', alpha=0.7)
+            segments += [np.column_stack([dates[has_mean], upper_band[has_mean]]),
+                         np.column_stack([dates[has_mean], lower_band[has_mean]])]
+            colors += [to_rgba('red', 0.7)] * 2
+            linewidths += [0.8, 0.8]
+        
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidths))
+        ax.xaxis_date()
+        ax.autoscale_view()
         
         # Mark buy/sell signals
         self._add_trading_signals(ax, test_data)
         
         # Format title and legend
-        self._format_subplot(ax, window, threshold, sharpe_display, best_params, show_legend, drawdown_display)
+        self._format_subplot(ax, window, threshold, sharpe_display, best_params, show_legend, drawdown_display,
+                             legend_proxies)
     
     def plot_single_strategy_portfolio(self, ax, test_data, sharpe, window, threshold=None,
                                      best_params=None, show_legend=False, max_drawdown=None):
@@ -70,26 +89,31 @@ class StrategyPlotter:
         # Format title and legend  
         self._format_subplot(ax, window, threshold, sharpe_display, best_params, show_legend, drawdown_display)
     
+    def _signal_points(self, test_data, column):
+        """Return dates, values of column, and buy/sell masks as NumPy arrays."""
+        # Mask two arrays instead of slicing every column of test_data into a sub-DataFrame
+        position = test_data['Position'].to_numpy()
+        return test_data.index.to_numpy(), test_data[column].to_numpy(), position == 1, position == -1
+    
     def _add_trading_signals(self, ax, test_data):
         """Add buy/sell signal markers to price plot."""
-        buy_signals = test_data[test_data['Position'] == 1]
-        ax.scatter(buy_signals.index, buy_signals[f'Close_{self.ticker}'], 
+        dates, close, buy, sell = self._signal_points(test_data, f'Close_{self.ticker}')
+        ax.scatter(dates[buy], close[buy], 
                   marker='^', color='green', label='Buy', s=40, alpha=0.7)
-        sell_signals = test_data[test_data['Position'] == -1]
-        ax.scatter(sell_signals.index, sell_signals[f'Close_{self.ticker}'], 
+        ax.scatter(dates[sell], close[sell], 
                   marker='v', color='red', label='Sell', s=40, alpha=0.7)
     
     def _add_portfolio_signals(self, ax, test_data):
         """Add buy/sell signal markers to portfolio plot."""
-        buy_signals = test_data[test_data['Position'] == 1]
-        ax.scatter(buy_signals.index, buy_signals['PortfolioValue'], 
+        dates, value, buy, sell = self._signal_points(test_data, 'PortfolioValue')
+        ax.scatter(dates[buy], value[buy], 
                   marker='^', color='green', s=35, alpha=0.7)
-        sell_signals = test_data[test_data['Position'] == -1]
-        ax.scatter(sell_signals.index, sell_signals['PortfolioValue'], 
+        ax.scatter(dates[sell], value[sell], 
                   marker='v', color='red', s=35, alpha=0.7)
     
-    def _format_subplot(self, ax, window, threshold, sharpe_display, best_params, show_legend, drawdown_display=None):
-        """Format subplot with title, legend, and grid."""
+    def _format_subplot(self, ax, window, threshold, sharpe_display, best_params, show_legend, drawdown_display=None,
+                        legend_proxies=()):
+        """Format subplot with title, legend, and grid (legend_proxies go ahead of the labelled artists)."""
         # Determine if this is the best parameter combination
         if threshold is not None:
             is_best = best_params == (window, threshold)
@@ -107,7 +131,8 @@ class StrategyPlotter:
                     fontweight='bold' if is_best else 'normal')
         
         if show_legend:
-            ax.legend(fontsize=8 if threshold is not None else 9)
+            handles = list(legend_proxies) + ax.get_legend_handles_labels()[0]
+            ax.legend(handles=handles, fontsize=8 if threshold is not None else 9)
         ax.grid(True, alpha=0.3)
     
     def create_mean_reversion_plots(self, results, best_params):
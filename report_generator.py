@@ -1,264 +1,544 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 import os
-from matplotlib.backends.backend_pdf import PdfPages
-import numpy as np
-import finance_utils
+from queue import Queue
+from threading import Thread
+import unicodedata
+
+# pandas, numpy and matplotlib (and the project modules that pull them in) are only
+# imported by _lazy() once a report is actually generated, so declining the
+# report prompt costs nothing.
+np = matplotlib = mdates = finance_utils = parameter_explorer = None
+LineCollection = Figure = Line2D = PercentFormatter = PdfPages = None
+
+
+def _lazy():
+    """Import the plotting and data stack into module globals on first use."""
+    global np, matplotlib, mdates, finance_utils, parameter_explorer
+    global LineCollection, Figure, Line2D, PercentFormatter, PdfPages
+    if Figure is not None:
+        return
+    import numpy as np
+    import matplotlib
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    from matplotlib.ticker import PercentFormatter
+    from matplotlib.backends.backend_pdf import PdfPages
+    import finance_utils
+    import parameter_explorer
+    # Bound last: Figure doubles as the "already loaded" flag checked above
+    from matplotlib.figure import Figure
+
+
+# Reports are rendered straight to file through Figure objects that never touch
+# pyplot, so no GUI backend is started. Long polylines are simplified once at
+# draw time and the auto layout engine stays off (each page sets its margins).
+# Text uses the 14 standard PDF fonts (Helvetica/Times/Courier), which viewers
+# ship themselves, so no font files are subset and embedded into the report.
+_REPORT_RC = {
+    'figure.autolayout': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'pdf.use14corefonts': True,
+}
+
+DISCLAIMER_TEXT = ("DISCLAIMER: This report is for educational purposes only and does not constitute financial advice. "
+                   "Past performance does not guarantee future results. Trading involves risk and can result in losses. "
+                   "Consult a qualified financial advisor before making investment decisions.")
+
+# Symbols AI answers commonly use that cp1252 lacks, spelled out with characters it has
+_CORE_FONT_REPLACEMENTS = str.maketrans({
+    '\u03c3': 'sigma', '\u03bc': 'mu', '\u03b1': 'alpha', '\u03b2': 'beta', '\u0394': 'Delta', '\u03b4': 'delta',
+    '\u2248': '~', '\u2264': '<=', '\u2265': '>=', '\u2260': '!=', '\u2212': '-',
+    '\u2192': '->', '\u2190': '<-', '\u2191': 'up', '\u2193': 'down',
+})
+
+
+def _core_font_text(text):
+    """
+    Make external (AI) text printable with the 14 core PDF fonts.
+
+    Those fonts only cover cp1252 and the PDF backend writes anything else as '?'.
+    Characters cp1252 has (including '½', '²', 'µ') are kept as they are; of the rest,
+    known symbols are spelled out, others fall back to their unaccented base letter, and
+    whatever is left (emoji, pictographs) is dropped.
+    """
+    chars = []
+    for char in text:
+        try:
+            char.encode('cp1252')
+        except UnicodeEncodeError:
+            # Replacements are plain ASCII, so the NFKD pass leaves them untouched
+            char = unicodedata.normalize('NFKD', char.translate(_CORE_FONT_REPLACEMENTS))
+            char = char.encode('cp1252', 'ignore').decode('cp1252')
+        chars.append(char)
+    return ''.join(chars)
+
+
+def _suggestion_text(rec):
+    """Format a latest_trade_recommendation() result as the TODAY'S SUGGESTION line."""
+    as_of = rec['as_of_date']
+    return "TODAY'S SUGGESTION: {} ({}) as of {}{}".format(
+        rec['action'], rec['state'],
+        as_of.strftime('%Y-%m-%d') if isinstance(as_of, date) else str(as_of),
+        f" at {rec['price']:.2f}" if rec.get('price') is not None else "")
+
+
+def _lttb_downsample(x, y, n_out=1000):
+    """
+    Downsample a line to n_out points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between keeps the
+    point spanning the largest triangle with the previously kept point and the
+    average of the next bucket, which preserves peaks and troughs of the curve.
+    Series shorter than 2 * n_out are returned unchanged.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out < 3 or n < 2 * n_out:
+        return x, y
+
+    xf = x.astype(np.float64)
+    buckets = np.array_split(np.arange(1, n - 1), n_out - 2)
+    starts = np.array([b[0] for b in buckets])
+    counts = np.array([len(b) for b in buckets])
+    # Bucket averages, with the last point acting as the bucket after the final one
+    avg_x = np.append(np.add.reduceat(xf[1:n - 1], starts - 1) / counts, xf[-1])
+    avg_y = np.append(np.add.reduceat(y[1:n - 1], starts - 1) / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i, bucket in enumerate(buckets):
+        cx, cy = avg_x[i + 1], avg_y[i + 1]
+        area = np.abs((xf[a] - cx) * (y[bucket] - y[a]) - (xf[a] - xf[bucket]) * (cy - y[a]))
+        a = bucket[np.argmax(area)]
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+
+def _portfolio_segment(portfolio_data):
+    """Return the downsampled PortfolioValue curve as an (N, 2) array of date numbers and values."""
+    xs, ys = _lttb_downsample(portfolio_data.index.asi8, portfolio_data['PortfolioValue'].to_numpy())
+    return np.column_stack([mdates.date2num(xs.astype('datetime64[ns]')), ys])
+
+
+def _legend_corner(ax, segments):
+    """
+    Return the legend loc for the corner of ax that the curves in segments cross least.
+
+    loc='best' only weighs Line2D/patch artists, so it cannot see curves drawn through a
+    LineCollection and would place the legend over them. Call after autoscale_view().
+    """
+    # Data -> axes fraction for the current view limits
+    xy = ax.transLimits.transform(np.concatenate(segments))
+    left, right = xy[:, 0] < 0.4, xy[:, 0] > 0.6
+    bottom, top = xy[:, 1] < 0.3, xy[:, 1] > 0.7
+    # Ties keep the placement the page used before its curves became a LineCollection
+    counts = {
+        'lower left': np.count_nonzero(left & bottom),
+        'upper left': np.count_nonzero(left & top),
+        'upper right': np.count_nonzero(right & top),
+        'lower right': np.count_nonzero(right & bottom),
+    }
+    return min(counts, key=counts.get)
+
+
+class _BackgroundPdfWriter:
+    """
+    Write-behind wrapper around PdfPages.
+
+    Pages hand finished figures to savefig() as usual, but the figures are
+    serialized to the PDF on a worker thread, so building the next page overlaps
+    with writing the previous one. The bounded queue keeps at most `maxsize`
+    pages waiting in memory. The first error raised while writing is re-raised
+    when the context exits.
+
+    Pages get their Figure from figure(): once a page has been written the
+    worker clears it and hands it back for reuse, so a report allocates at most
+    maxsize + 2 figures (queued, being written, being built) however many
+    pages it has. Figures created elsewhere are written but never cleared.
+    """
+    
+    def __init__(self, pdf, maxsize=2, figsize=(8.27, 11.69)):
+        self._pdf = pdf
+        self._queue = Queue(maxsize=maxsize)
+        self._free = Queue()
+        self._figsize = figsize
+        self._max_figures = maxsize + 2
+        self._owned = set()
+        self._error = None
+        self._thread = Thread(target=self._run, name='pdf-writer', daemon=True)
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._queue.put(None)
+        self._thread.join()
+        # Every page is in the PDF now; release the pooled figures right away rather
+        # than whenever the writer itself goes out of scope
+        self._owned.clear()
+        while not self._free.empty():
+            self._free.get_nowait()
+        if exc_type is None and self._error is not None:
+            raise self._error
+        return False
+    
+    def figure(self):
+        """Return a blank page Figure, reusing one the worker has finished with when possible."""
+        if self._free.empty() and len(self._owned) < self._max_figures:
+            fig = Figure(figsize=self._figsize)
+            self._owned.add(fig)
+            return fig
+        return self._free.get()
+    
+    def savefig(self, fig, **kwargs):
+        """Queue a figure for writing; blocks only while the queue is full."""
+        self._queue.put((fig, kwargs))
+    
+    def _recycle(self, fig):
+        # clear() keeps the subplot parameters, so restore the defaults that pages
+        # without their own subplots_adjust() rely on
+        fig.clear()
+        fig.subplots_adjust(**{k: matplotlib.rcParams[f'figure.subplot.{k}']
+                               for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+        self._free.put(fig)
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            # Keep draining after a failure so the producer never blocks on a full queue
+            fig, kwargs = item
+            if self._error is None:
+                try:
+                    self._pdf.savefig(fig, **kwargs)
+                except Exception as e:
+                    self._error = e
+            if fig in self._owned:
+                self._recycle(fig)
+
 
 class StrategyReportGenerator:
     """Generate PDF reports for strategy analysis results."""
     
+    # Set once the font manager and PDF backend have rendered a throwaway page
+    _warmed = False
+    
     def __init__(self, ticker):
         self.ticker = ticker
-        
+        if not StrategyReportGenerator._warmed:
+            self._warm_up()
+        # Timestamp shown on the pages, set once at the start of each report
+        self._report_date = None
+        
+    @classmethod
+    def _warm_up(cls):
+        """Render a 1x1 dummy page in memory so the first real report starts with warm caches."""
+        from io import BytesIO
+        _lazy()
+        with matplotlib.rc_context(_REPORT_RC):
+            fig = Figure(figsize=(1, 1))
+            fig.text(0.5, 0.5, 'x')
+            fig.savefig(BytesIO(), format='pdf')
+        cls._warmed = True
+    
     def generate_basic_report(self, results, filename=None):
         """Generate PDF report for basic strategy comparison."""
+        now = datetime.now()
+        self._report_date = now.strftime("%Y-%m-%d %H:%M:%S")
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"strategy_report_{self.ticker}_{timestamp}.pdf"
         
-        with PdfPages(filename) as pdf:
+        _lazy()
+        # Display names shared by every page, e.g. 'mean_reversion' -> 'Mean Reversion'
+        pretty_names = {name: name.replace('_', ' ').title() for name in results}
+        
+        with matplotlib.rc_context(_REPORT_RC), PdfPages(filename) as pdf_file, \
+                _BackgroundPdfWriter(pdf_file) as pdf:
             # Page 1: Summary
-            self._create_summary_page(pdf, results)
+            self._create_summary_page(pdf, results, pretty_names)
             
             # Page 2: Portfolio Performance Chart
-            self._create_portfolio_chart_page(pdf, results)
+            self._create_portfolio_chart_page(pdf, results, pretty_names)
             
             # Page 3: Risk Metrics
-            self._create_risk_metrics_page(pdf, results)
+            self._create_risk_metrics_page(pdf, results, pretty_names)
         
         return filename
     
     def generate_full_report(self, mr_results, mom_results, mr_best_params, mom_best_params, filename=None):
         """Generate comprehensive PDF report for full parameter exploration."""
+        now = datetime.now()
+        self._report_date = now.strftime("%Y-%m-%d %H:%M:%S")
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"full_analysis_report_{self.ticker}_{timestamp}.pdf"
         
-        with PdfPages(filename) as pdf:
+        _lazy()
+        # Index the results once so every page looks up the best rows in O(1)
+        mr_by_key = {(r['Window'], r['Threshold']): r for r in mr_results}
+        mom_by_window = {r['Window']: r for r in mom_results}
+        # Column arrays for the chart pages, extracted once instead of per page
+        mr_columns = parameter_explorer.results_to_arrays(mr_results, ['Window', 'Threshold', 'Sharpe_Ratio'])
+        mom_columns = parameter_explorer.results_to_arrays(mom_results, ['Window', 'Sharpe_Ratio'])
+        
+        # The AI analysis is a network round trip; start it now so it overlaps pages 1-3
+        ai_analysis = self._start_market_analysis(mr_best_params, mom_best_params, mr_by_key, mom_by_window)
+        
+        with matplotlib.rc_context(_REPORT_RC), PdfPages(filename) as pdf_file, \
+                _BackgroundPdfWriter(pdf_file) as pdf:
             # Page 1: Executive Summary
-            self._create_executive_summary_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params)
+            self._create_executive_summary_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                                mr_by_key, mom_by_window)
             
             # Page 2: Strategy Performance Overview
-            self._create_strategy_overview_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params)
+            self._create_strategy_overview_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                                mr_by_key, mom_by_window)
             
             # Page 3: Parameter Analysis Charts
-            self._create_parameter_charts_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params)
+            self._create_parameter_charts_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                               mr_by_key, mom_by_window, mr_columns, mom_columns)
             
             # Page 4: AI Analysis & Key Insights  
-            self._create_insights_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params)
+            self._create_insights_page(pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                       mr_by_key, mom_by_window, ai_analysis)
             
             # Page 5: Glossary
             self._create_glossary_page(pdf)
         
         return filename
     
-    def _create_summary_page(self, pdf, results):
+    def _start_market_analysis(self, mr_best_params, mom_best_params, mr_by_key, mom_by_window):
+        """Request the AI market behavior analysis on a background thread; returns a Future or None."""
+        if not (mr_best_params and mom_best_params):
+            return None
+        import ai_utils
+        best_mr = mr_by_key[tuple(mr_best_params)]
+        best_mom = mom_by_window[mom_best_params]
+        winning_strategy = "Mean Reversion" if best_mr['Sharpe_Ratio'] > best_mom['Sharpe_Ratio'] else "Momentum"
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ai-analysis')
+        future = executor.submit(
+            ai_utils.cached_market_behavior_analysis,
+            self.ticker, winning_strategy,
+            best_mr['Sharpe_Ratio'], best_mom['Sharpe_Ratio'],
+            mr_best_params, mom_best_params,
+            best_mr.get('Max_Drawdown'), best_mom.get('Max_Drawdown')
+        )
+        # The worker thread exits once the request finishes
+        executor.shutdown(wait=False)
+        return future
+    
+    def _create_summary_page(self, pdf, results, pretty_names):
         """Create summary page for basic report."""
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
+        ax = fig.subplots()
         ax.axis('off')
+        # Many text artists on this page; bind the method and transform once
+        ax_text = ax.text
+        tr = ax.transAxes
         
         # Title
         fig.suptitle(f'Strategy Analysis Report - {self.ticker}', fontsize=20, fontweight='bold')
         
         # Report metadata
-        report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ax.text(0.1, 0.9, f'Report Generated: {report_date}', fontsize=12, transform=ax.transAxes)
-        ax.text(0.1, 0.85, f'Ticker: {self.ticker}', fontsize=12, fontweight='bold', transform=ax.transAxes)
+        ax_text(0.1, 0.9, f'Report Generated: {self._report_date}', fontsize=12, transform=tr)
+        ax_text(0.1, 0.85, f'Ticker: {self.ticker}', fontsize=12, fontweight='bold', transform=tr)
         
         # Strategy results
         y_pos = 0.75
-        ax.text(0.1, y_pos, 'STRATEGY PERFORMANCE SUMMARY', fontsize=16, fontweight='bold', transform=ax.transAxes)
+        ax_text(0.1, y_pos, 'STRATEGY PERFORMANCE SUMMARY', fontsize=16, fontweight='bold', transform=tr)
         
-        y_pos -= 0.08
+        # One Text artist for the whole table instead of four per strategy
+        y_pos -= 0.05
+        blocks = []
         for strategy_name, data in results.items():
-            strategy_title = strategy_name.replace('_', ' ').title()
-            ax.text(0.1, y_pos, f'{strategy_title}:', fontsize=14, fontweight='bold', transform=ax.transAxes)
-            
-            y_pos -= 0.05
+            strategy_title = pretty_names[strategy_name]
             sharpe = data['sharpe']
-            if sharpe is not None:
-                ax.text(0.15, y_pos, f'Sharpe Ratio: {sharpe:.4f}', fontsize=12, transform=ax.transAxes)
-            else:
-                ax.text(0.15, y_pos, 'Sharpe Ratio: Unable to calculate', fontsize=12, transform=ax.transAxes)
-            
-            y_pos -= 0.04
+            sharpe_str = f'{sharpe:.4f}' if sharpe is not None else 'Unable to calculate'
             drawdown = data['drawdown']['max_drawdown']
-            if drawdown is not None:
-                ax.text(0.15, y_pos, f'Max Drawdown: {drawdown:.2%}', fontsize=12, transform=ax.transAxes)
-            else:
-                ax.text(0.15, y_pos, 'Max Drawdown: N/A', fontsize=12, transform=ax.transAxes)
-            
-            # Parameters
-            y_pos -= 0.04
-            params = data['params']
-            param_text = ', '.join([f'{k.title()}: {v}' for k, v in params.items()])
-            ax.text(0.15, y_pos, f'Parameters: {param_text}', fontsize=12, transform=ax.transAxes)
-            
-            y_pos -= 0.08
+            drawdown_str = f'{drawdown:.2%}' if drawdown is not None else 'N/A'
+            param_text = ', '.join(f'{k.title()}: {v}' for k, v in data['params'].items())
+            blocks.append(f'{strategy_title}:\n'
+                          f'  Sharpe Ratio: {sharpe_str}\n'
+                          f'  Max Drawdown: {drawdown_str}\n'
+                          f'  Parameters: {param_text}')
+        ax_text(0.1, y_pos, '\n\n'.join(blocks), fontsize=12, verticalalignment='top',
+                family='monospace', linespacing=1.4, transform=tr)
+        y_pos -= 0.14 * len(blocks) + 0.02
         
         # Winner determination
         sharpes = [data['sharpe'] for data in results.values() if data['sharpe'] is not None]
         if sharpes:
             best_strategy = max(results.keys(), key=lambda k: results[k]['sharpe'] if results[k]['sharpe'] else -np.inf)
-            ax.text(0.1, y_pos, f'BEST PERFORMING STRATEGY: {best_strategy.replace("_", " ").title()}', 
-                   fontsize=14, fontweight='bold', color='green', transform=ax.transAxes)
+            ax_text(0.1, y_pos, f'BEST PERFORMING STRATEGY: {pretty_names[best_strategy]}', 
+                   fontsize=14, fontweight='bold', color='green', transform=tr)
 
             # Today's suggestion from the best-performing strategy
             try:
                 y_pos -= 0.06
                 rec = finance_utils.latest_trade_recommendation(results[best_strategy]['data'], ticker=self.ticker)
                 if rec and rec.get('as_of_date') is not None:
-                    date_str = rec['as_of_date'].strftime('%Y-%m-%d') if hasattr(rec['as_of_date'], 'strftime') else str(rec['as_of_date'])
-                    price_str = f" at {rec['price']:.2f}" if rec.get('price') is not None else ""
-                    ax.text(0.1, y_pos, f"TODAY'S SUGGESTION: {rec['action']} ({rec['state']}) as of {date_str}{price_str}",
-                            fontsize=12, fontweight='bold', color='black', transform=ax.transAxes)
+                    ax_text(0.1, y_pos, _suggestion_text(rec),
+                            fontsize=12, fontweight='bold', color='black', transform=tr)
                     y_pos -= 0.035
-                    ax.text(0.1, y_pos, "Note: This is not financial advice.", fontsize=10, color='dimgray', transform=ax.transAxes)
+                    ax_text(0.1, y_pos, "Note: This is not financial advice.", fontsize=10, color='dimgray', transform=tr)
             except Exception:
                 pass
         
         # Add disclaimer as footnote
-        disclaimer = ("DISCLAIMER: This report is for educational purposes only and does not constitute financial advice. "
-                     "Past performance does not guarantee future results. Trading involves risk and can result in losses. "
-                     "Consult a qualified financial advisor before making investment decisions.")
-        ax.text(0.05, 0.02, disclaimer, transform=ax.transAxes, fontsize=7,
+        ax_text(0.05, 0.02, DISCLAIMER_TEXT, transform=tr, fontsize=7,
                 verticalalignment='bottom', style='italic', color='gray', wrap=True)
         
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        pdf.savefig(fig)
     
-    def _create_portfolio_chart_page(self, pdf, results):
+    def _create_portfolio_chart_page(self, pdf, results, pretty_names):
         """Create portfolio performance chart page."""
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 format
-        
-        for strategy_name, data in results.items():
-            portfolio_data = data['data']
-            sharpe = data.get('sharpe')
-            drawdown = None
-            if isinstance(data.get('drawdown'), dict):
-                drawdown = data['drawdown'].get('max_drawdown')
-
-            label = f"{strategy_name.replace('_', ' ').title()}"
-            metrics = []
-            if sharpe is not None:
-                metrics.append(f"Sharpe: {sharpe:.3f}")
-            if drawdown is not None:
-                metrics.append(f"DD: {drawdown:.2%}")
+        fig = pdf.figure()  # A4 format
+        ax = fig.subplots()
+        
+        # Format every strategy's metrics in one vectorized pass; missing values become NaN
+        sharpes = np.array([data.get('sharpe') for data in results.values()], dtype=np.float64)
+        drawdowns = np.array([data['drawdown'].get('max_drawdown') if isinstance(data.get('drawdown'), dict) else None
+                              for data in results.values()], dtype=np.float64)
+        sharpe_labels = np.char.mod('Sharpe: %.3f', sharpes)
+        drawdown_labels = np.char.mod('DD: %.2f%%', drawdowns * 100)
+        
+        # All curves go into one LineCollection; Line2D proxies carry the legend entries
+        cycle_colors = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+        segments = []
+        legend_handles = []
+        for i, (strategy_name, data) in enumerate(results.items()):
+            label = pretty_names[strategy_name]
+            metrics = [text for text, value in ((sharpe_labels[i], sharpes[i]), (drawdown_labels[i], drawdowns[i]))
+                       if not np.isnan(value)]
             if metrics:
                 label += " (" + ", ".join(metrics) + ")"
 
-            ax.plot(portfolio_data.index, portfolio_data['PortfolioValue'], label=label, linewidth=2)
+            color = cycle_colors[i % len(cycle_colors)]
+            segments.append(_portfolio_segment(data['data']))
+            legend_handles.append(Line2D([], [], color=color, linewidth=2, label=label))
+        
+        ax.add_collection(LineCollection(segments, colors=[h.get_color() for h in legend_handles], linewidths=2))
+        ax.xaxis_date()
+        # Concise labels only repeat the year/month where it changes, keeping long ranges readable
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        ax.tick_params(axis='x', labelrotation=45)
+        ax.autoscale_view()
         
         ax.set_title(f'Portfolio Value Evolution - {self.ticker}', fontsize=16, fontweight='bold')
         ax.set_ylabel('Portfolio Value', fontsize=12)
         ax.set_xlabel('Date', fontsize=12)
-        ax.legend(fontsize=10)
+        ax.legend(handles=legend_handles, loc=_legend_corner(ax, segments), fontsize=10)
         ax.grid(True, alpha=0.3)
         
-        # Rotate x-axis labels for better readability
-        plt.xticks(rotation=45)
-        
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        pdf.savefig(fig)
     
-    def _create_risk_metrics_page(self, pdf, results):
+    def _create_risk_metrics_page(self, pdf, results, pretty_names):
         """Create risk metrics comparison page."""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
+        ax1, ax2 = fig.subplots(2, 1)
         
-        # Sharpe Ratio Comparison
-        strategies = list(results.keys())
-        sharpe_ratios = [results[s]['sharpe'] if results[s]['sharpe'] else 0 for s in strategies]
-        strategy_labels = [s.replace('_', ' ').title() for s in strategies]
+        # Labels and both metrics in a single pass over the results
+        strategy_labels, sharpe_ratios, drawdowns = [], [], []
+        for strategy_name, data in results.items():
+            strategy_labels.append(pretty_names[strategy_name])
+            sharpe_ratios.append(data['sharpe'] or 0)
+            drawdowns.append((data.get('drawdown') or {}).get('max_drawdown') or 0)
         
+        # Sharpe Ratio Comparison
         bars1 = ax1.bar(strategy_labels, sharpe_ratios, color=['blue', 'red'])
         ax1.set_title('Sharpe Ratio Comparison', fontsize=14, fontweight='bold')
         ax1.set_ylabel('Sharpe Ratio')
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels on bars
-        for bar, value in zip(bars1, sharpe_ratios):
-            if value != 0:
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01, 
-                        f'{value:.3f}', ha='center', va='bottom')
+        ax1.bar_label(bars1, labels=[f'{v:.3f}' if v != 0 else '' for v in sharpe_ratios], padding=3)
         
         # Max Drawdown Comparison
-        drawdowns = [results[s]['drawdown']['max_drawdown'] if results[s]['drawdown']['max_drawdown'] else 0 for s in strategies]
         bars2 = ax2.bar(strategy_labels, drawdowns, color=['blue', 'red'])
         ax2.set_title('Maximum Drawdown Comparison', fontsize=14, fontweight='bold')
         ax2.set_ylabel('Max Drawdown')
         ax2.grid(True, alpha=0.3, axis='y')
         
         # Format y-axis as percentage
-        ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1%}'))
+        ax2.yaxis.set_major_formatter(PercentFormatter(xmax=1.0, decimals=1))
         
         # Add value labels on bars
-        for bar, value in zip(bars2, drawdowns):
-            if value != 0:
-                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.005, 
-                        f'{value:.2%}', ha='center', va='bottom')
+        ax2.bar_label(bars2, labels=[f'{v:.2%}' if v != 0 else '' for v in drawdowns], padding=3)
         
-        plt.tight_layout()
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        fig.subplots_adjust(left=0.12, right=0.96, top=0.92, bottom=0.08, wspace=0.25, hspace=0.3)
+        pdf.savefig(fig)
     
-    def _create_executive_summary_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params):
+    def _create_executive_summary_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                       mr_by_key, mom_by_window):
         """Create executive summary for full analysis report."""
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
+        ax = fig.subplots()
         ax.axis('off')
+        ax_text = ax.text
+        tr = ax.transAxes
         
         # Title
         fig.suptitle(f'Comprehensive Strategy Analysis - {self.ticker}', fontsize=18, fontweight='bold')
         
         # Report metadata
-        report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ax.text(0.1, 0.9, f'Report Generated: {report_date}', fontsize=12, transform=ax.transAxes)
+        ax_text(0.1, 0.9, f'Report Generated: {self._report_date}', fontsize=12, transform=tr)
         
         y_pos = 0.8
         
         # Mean Reversion Summary
-        ax.text(0.1, y_pos, 'MEAN REVERSION STRATEGY', fontsize=16, fontweight='bold', transform=ax.transAxes)
-        y_pos -= 0.05
+        ax_text(0.1, y_pos, 'MEAN REVERSION STRATEGY', fontsize=16, fontweight='bold', transform=tr)
+        y_pos -= 0.03
         
         if mr_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            ax.text(0.15, y_pos, f'Best Parameters: Window={mr_best_params[0]}, Threshold={mr_best_params[1]:.3f}', 
-                   fontsize=12, transform=ax.transAxes)
-            y_pos -= 0.04
-            ax.text(0.15, y_pos, f'Sharpe Ratio: {best_mr["Sharpe_Ratio"]:.4f}', fontsize=12, transform=ax.transAxes)
-            y_pos -= 0.04
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            mr_lines = [f'Best Parameters: Window={mr_best_params[0]}, Threshold={mr_best_params[1]:.3f}',
+                        f'Sharpe Ratio: {best_mr["Sharpe_Ratio"]:.4f}']
             if best_mr['Max_Drawdown']:
-                ax.text(0.15, y_pos, f'Max Drawdown: {best_mr["Max_Drawdown"]:.2%}', fontsize=12, transform=ax.transAxes)
+                mr_lines.append(f'Max Drawdown: {best_mr["Max_Drawdown"]:.2%}')
+            ax_text(0.15, y_pos, '\n'.join(mr_lines), fontsize=12, verticalalignment='top',
+                    linespacing=1.8, transform=tr)
+            y_pos -= 0.04 * len(mr_lines)
         
-        y_pos -= 0.08
+        y_pos -= 0.06
         
         # Momentum Summary
-        ax.text(0.1, y_pos, 'MOMENTUM STRATEGY', fontsize=16, fontweight='bold', transform=ax.transAxes)
-        y_pos -= 0.05
+        ax_text(0.1, y_pos, 'MOMENTUM STRATEGY', fontsize=16, fontweight='bold', transform=tr)
+        y_pos -= 0.03
         
         if mom_best_params:
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
-            ax.text(0.15, y_pos, f'Best Parameter: Window={mom_best_params}', fontsize=12, transform=ax.transAxes)
-            y_pos -= 0.04
-            ax.text(0.15, y_pos, f'Sharpe Ratio: {best_mom["Sharpe_Ratio"]:.4f}', fontsize=12, transform=ax.transAxes)
-            y_pos -= 0.04
+            best_mom = mom_by_window[mom_best_params]
+            mom_lines = [f'Best Parameter: Window={mom_best_params}',
+                         f'Sharpe Ratio: {best_mom["Sharpe_Ratio"]:.4f}']
             if best_mom['Max_Drawdown']:
-                ax.text(0.15, y_pos, f'Max Drawdown: {best_mom["Max_Drawdown"]:.2%}', fontsize=12, transform=ax.transAxes)
+                mom_lines.append(f'Max Drawdown: {best_mom["Max_Drawdown"]:.2%}')
+            ax_text(0.15, y_pos, '\n'.join(mom_lines), fontsize=12, verticalalignment='top',
+                    linespacing=1.8, transform=tr)
+            y_pos -= 0.04 * len(mom_lines)
         
         # Overall recommendation
-        y_pos -= 0.1
-        ax.text(0.1, y_pos, 'RECOMMENDATION', fontsize=16, fontweight='bold', color='green', transform=ax.transAxes)
+        y_pos -= 0.06
+        ax_text(0.1, y_pos, 'RECOMMENDATION', fontsize=16, fontweight='bold', color='green', transform=tr)
         y_pos -= 0.05
         
         if mr_best_params and mom_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             
             if best_mr['Sharpe_Ratio'] > best_mom['Sharpe_Ratio']:
-                ax.text(0.15, y_pos, f'Mean Reversion strategy is recommended', fontsize=12, fontweight='bold', transform=ax.transAxes)
+                ax_text(0.15, y_pos, f'Mean Reversion strategy is recommended', fontsize=12, fontweight='bold', transform=tr)
             else:
-                ax.text(0.15, y_pos, f'Momentum strategy is recommended', fontsize=12, fontweight='bold', transform=ax.transAxes)
+                ax_text(0.15, y_pos, f'Momentum strategy is recommended', fontsize=12, fontweight='bold', transform=tr)
 
             # Today's suggestion from the higher-Sharpe best strategy
             try:
@@ -266,45 +546,46 @@ class StrategyReportGenerator:
                 preferred = best_mr if best_mr['Sharpe_Ratio'] >= best_mom['Sharpe_Ratio'] else best_mom
                 rec = finance_utils.latest_trade_recommendation(preferred['Data'], ticker=self.ticker)
                 if rec and rec.get('as_of_date') is not None:
-                    date_str = rec['as_of_date'].strftime('%Y-%m-%d') if hasattr(rec['as_of_date'], 'strftime') else str(rec['as_of_date'])
-                    price_str = f" at {rec['price']:.2f}" if rec.get('price') is not None else ""
-                    ax.text(0.15, y_pos, f"TODAY'S SUGGESTION: {rec['action']} ({rec['state']}) as of {date_str}{price_str}",
-                            fontsize=12, fontweight='bold', color='black', transform=ax.transAxes)
+                    ax_text(0.15, y_pos, _suggestion_text(rec),
+                            fontsize=12, fontweight='bold', color='black', transform=tr)
                     y_pos -= 0.035
-                    ax.text(0.15, y_pos, "Note: This is not financial advice.", fontsize=10, color='dimgray', transform=ax.transAxes)
+                    ax_text(0.15, y_pos, "Note: This is not financial advice.", fontsize=10, color='dimgray', transform=tr)
             except Exception:
                 pass
         
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        pdf.savefig(fig)
     
-    def _create_strategy_overview_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params):
+    def _create_strategy_overview_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                       mr_by_key, mom_by_window):
         """Create strategy performance overview page with single column layout."""
-        fig = plt.figure(figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
         fig.suptitle(f'Strategy Performance Overview - {self.ticker}', fontsize=14, fontweight='bold', y=0.95)
         
         # Create 4 subplots in single column
-        ax1 = plt.subplot(4, 1, 1)
-        ax2 = plt.subplot(4, 1, 2)
-        ax3 = plt.subplot(4, 1, 3)
-        ax4 = plt.subplot(4, 1, 4)
+        ax1 = fig.add_subplot(4, 1, 1)
+        ax2 = fig.add_subplot(4, 1, 2)
+        ax3 = fig.add_subplot(4, 1, 3)
+        ax4 = fig.add_subplot(4, 1, 4)
         
         if mr_best_params and mom_best_params:
             # Get best results
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             
             # Portfolio Performance Comparison
             mr_data = best_mr['Data']
             mom_data = best_mom['Data']
             
-            ax1.plot(mr_data.index, mr_data['PortfolioValue'], 
-                    label=f'Mean Reversion', linewidth=2, color='blue')
-            ax1.plot(mom_data.index, mom_data['PortfolioValue'], 
-                    label=f'Momentum', linewidth=2, color='red')
+            ax1.add_collection(LineCollection(
+                [_portfolio_segment(mr_data), _portfolio_segment(mom_data)],
+                colors=['blue', 'red'], linewidths=2))
+            ax1.xaxis_date()
+            ax1.autoscale_view()
             ax1.set_title('Portfolio Value Evolution', fontsize=12, pad=10)
             ax1.set_ylabel('Portfolio Value ($)', fontsize=10)
-            ax1.legend(loc='upper left', fontsize=9)
+            ax1.legend(handles=[Line2D([], [], color='blue', linewidth=2, label='Mean Reversion'),
+                                Line2D([], [], color='red', linewidth=2, label='Momentum')],
+                       loc='upper left', fontsize=9)
             ax1.grid(True, alpha=0.3)
             
             # No caption - information is in legend
@@ -317,18 +598,25 @@ class StrategyReportGenerator:
                 best_data = mom_data
                 strategy_name = 'Momentum'
             
-            ax2.plot(best_data.index, best_data[f'Close_{self.ticker}'], 
-                    label=f'{self.ticker}', color='black', linewidth=1.5)
+            # Extract the arrays once and mask them instead of copying row subsets; the
+            # dates are converted to Matplotlib day numbers once for the line and both markers
+            dates = mdates.date2num(best_data.index)
+            close = best_data[f'Close_{self.ticker}'].to_numpy()
+            position = best_data['Position'].to_numpy()
+            buy = position == 1
+            sell = position == -1
             
-            buy_signals = best_data[best_data['Position'] == 1]
-            sell_signals = best_data[best_data['Position'] == -1]
+            # Only the price line is downsampled; the markers keep their exact positions
+            ax2.plot(*_lttb_downsample(dates, close), 
+                    label=f'{self.ticker}', color='black', linewidth=1.5)
             
-            if not buy_signals.empty:
-                ax2.scatter(buy_signals.index, buy_signals[f'Close_{self.ticker}'], 
+            if buy.any():
+                ax2.scatter(dates[buy], close[buy], 
                            marker='^', color='green', s=25, label='Buy', alpha=0.8, zorder=5)
-            if not sell_signals.empty:
-                ax2.scatter(sell_signals.index, sell_signals[f'Close_{self.ticker}'], 
+            if sell.any():
+                ax2.scatter(dates[sell], close[sell], 
                            marker='v', color='red', s=25, label='Sell', alpha=0.8, zorder=5)
+            ax2.xaxis_date()
             
             ax2.set_title(f'Trading Signals: {strategy_name}', fontsize=12, pad=10)
             ax2.set_ylabel('Price ($)', fontsize=10)
@@ -348,10 +636,8 @@ class StrategyReportGenerator:
             ax3.grid(True, alpha=0.3, axis='y')
             
             # Add value labels on bars
-            for bar, value in zip(bars, sharpe_values):
-                height = bar.get_height()
-                ax3.text(bar.get_x() + bar.get_width()/2, height + 0.02, 
-                        f'{value:.3f}', ha='center', va='bottom', fontweight='bold', fontsize=9)
+            ax3.bar_label(bars, fmt='%.3f', padding=2, fontweight='bold', fontsize=9)
+            ax3.margins(y=0.15)  # headroom so labels stay inside the axes
             
             # No caption needed
             
@@ -360,60 +646,59 @@ class StrategyReportGenerator:
             bars2 = ax4.bar(strategies, drawdown_values, color=colors, alpha=0.7, width=0.6)
             ax4.set_title('Maximum Drawdown', fontsize=12, pad=10)
             ax4.set_ylabel('Max Drawdown', fontsize=10)
-            ax4.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1%}'))
+            ax4.yaxis.set_major_formatter(PercentFormatter(xmax=1.0, decimals=1))
             ax4.grid(True, alpha=0.3, axis='y')
             
             # Add value labels on bars
-            for bar, value in zip(bars2, drawdown_values):
-                if value is not None:
-                    height = bar.get_height()
-                    ax4.text(bar.get_x() + bar.get_width()/2, height + 0.005, 
-                            f'{value:.1%}', ha='center', va='bottom', fontweight='bold', fontsize=9)
+            ax4.bar_label(bars2, labels=[f'{v:.1%}' if v is not None else '' for v in drawdown_values],
+                          padding=2, fontweight='bold', fontsize=9)
+            ax4.margins(y=0.15)
             
             # No caption needed
         
         # Single column layout with proper spacing
-        plt.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.05, hspace=0.4)
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.05, hspace=0.4)
+        pdf.savefig(fig)
     
-    def _create_parameter_charts_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params):
+    def _create_parameter_charts_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                                      mr_by_key, mom_by_window, mr_columns, mom_columns):
         """Create parameter analysis charts page with single column layout."""
-        fig = plt.figure(figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
         fig.suptitle('Parameter Sensitivity Analysis', fontsize=14, fontweight='bold', y=0.95)
         
         # Create 3 subplots in single column (2 charts + 1 summary)
-        ax1 = plt.subplot(3, 1, 1)
-        ax2 = plt.subplot(3, 1, 2)
-        ax3 = plt.subplot(3, 1, 3)
+        ax1 = fig.add_subplot(3, 1, 1)
+        ax2 = fig.add_subplot(3, 1, 2)
+        ax3 = fig.add_subplot(3, 1, 3)
         ax3.axis('off')  # For text summary
         
         # Mean Reversion Parameter Heatmap
         if mr_results:
-            mr_df = pd.DataFrame([
-                {'Window': r['Window'], 'Threshold': r['Threshold'], 'Sharpe_Ratio': r['Sharpe_Ratio']} 
-                for r in mr_results
-            ])
-            
-            sharpe_pivot = mr_df.pivot(index='Window', columns='Threshold', values='Sharpe_Ratio')
-            im1 = ax1.imshow(sharpe_pivot.values, cmap='RdYlGn', aspect='auto')
+            # The sweep is a Window x Threshold grid, so scatter the Sharpe ratios
+            # straight into a 2-D array instead of pivoting a DataFrame
+            w_u, w_idx = np.unique(mr_columns['Window'], return_inverse=True)
+            t_u, t_idx = np.unique(mr_columns['Threshold'], return_inverse=True)
+            sharpe_grid = np.full((w_u.size, t_u.size), np.nan)
+            sharpe_grid[w_idx, t_idx] = mr_columns['Sharpe_Ratio']
+            
+            im1 = ax1.imshow(sharpe_grid, cmap='RdYlGn', aspect='auto')
             ax1.set_title('Mean Reversion: Parameter Heatmap', fontsize=11, pad=8)
-            ax1.set_xticks(range(len(sharpe_pivot.columns)))
-            ax1.set_xticklabels([f'{x:.1%}' for x in sharpe_pivot.columns], fontsize=8)
-            ax1.set_yticks(range(len(sharpe_pivot.index)))
-            ax1.set_yticklabels(sharpe_pivot.index, fontsize=8)
+            ax1.set_xticks(range(t_u.size))
+            ax1.set_xticklabels([f'{x:.1%}' for x in t_u], fontsize=8)
+            ax1.set_yticks(range(w_u.size))
+            ax1.set_yticklabels(w_u, fontsize=8)
             ax1.set_xlabel('Threshold', fontsize=9)
             ax1.set_ylabel('Window', fontsize=9)
-            plt.colorbar(im1, ax=ax1, fraction=0.046, pad=0.04)
+            fig.colorbar(im1, ax=ax1, fraction=0.046, pad=0.04)
         
         # Momentum Window Performance
         if mom_results:
-            mom_df = pd.DataFrame([
-                {'Window': r['Window'], 'Sharpe_Ratio': r['Sharpe_Ratio']} 
-                for r in mom_results
-            ])
+            # Sorted by window so the best bar can be found with a binary search
+            order = np.argsort(mom_columns['Window'], kind='stable')
+            windows = mom_columns['Window'][order]
+            sharpes = mom_columns['Sharpe_Ratio'][order]
             
-            bars = ax2.bar(mom_df['Window'], mom_df['Sharpe_Ratio'], color='steelblue', alpha=0.7, width=6)
+            bars = ax2.bar(windows, sharpes, color='steelblue', alpha=0.7, width=6)
             ax2.set_title('Momentum: Window Optimization', fontsize=11, pad=8)
             ax2.set_xlabel('Window Size (days)', fontsize=9)
             ax2.set_ylabel('Sharpe Ratio', fontsize=9)
@@ -421,14 +706,14 @@ class StrategyReportGenerator:
             
             # Highlight best parameter
             if mom_best_params:
-                best_idx = mom_df[mom_df['Window'] == mom_best_params].index[0]
+                best_idx = int(np.searchsorted(windows, mom_best_params))
                 bars[best_idx].set_color('green')
                 bars[best_idx].set_alpha(0.9)
         
         # Summary text without boxes
         if mr_best_params and mom_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             
             summary_text = f"OPTIMAL PARAMETERS:\n\n"
             summary_text += f"Mean Reversion: Window={mr_best_params[0]}d, Threshold={mr_best_params[1]:.1%}, Sharpe={best_mr['Sharpe_Ratio']:.3f}\n"
@@ -440,13 +725,15 @@ class StrategyReportGenerator:
                     verticalalignment='top', fontfamily='monospace')
         
         # Single column spacing
-        plt.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.05, hspace=0.4)
+        fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.05, hspace=0.4)
+        # dpi only affects raster content such as the heatmap image; vector pages omit it
         pdf.savefig(fig, dpi=150)
-        plt.close(fig)
     
-    def _create_insights_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params):
+    def _create_insights_page(self, pdf, mr_results, mom_results, mr_best_params, mom_best_params,
+                              mr_by_key, mom_by_window, ai_analysis=None):
         """Create AI insights page (A4 format)."""
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
+        ax = fig.subplots()
         ax.axis('off')
         
         # Title
@@ -455,8 +742,8 @@ class StrategyReportGenerator:
         insights_text = ""
         
         if mr_best_params and mom_best_params:
-            best_mr = next(r for r in mr_results if r['Window'] == mr_best_params[0] and r['Threshold'] == mr_best_params[1])
-            best_mom = next(r for r in mom_results if r['Window'] == mom_best_params)
+            best_mr = mr_by_key[tuple(mr_best_params)]
+            best_mom = mom_by_window[mom_best_params]
             
             # Determine winning strategy
             winning_strategy = "Mean Reversion" if best_mr['Sharpe_Ratio'] > best_mom['Sharpe_Ratio'] else "Momentum"
@@ -477,16 +764,18 @@ class StrategyReportGenerator:
             
             # AI-powered market behavior analysis
             insights_text += f"AI MARKET BEHAVIOR ANALYSIS\n\n"
-            try:
-                import ai_utils
-                ai_analysis = ai_utils.generate_market_behavior_analysis(
-                    self.ticker, winning_strategy, 
-                    best_mr['Sharpe_Ratio'], best_mom['Sharpe_Ratio'],
-                    mr_best_params, mom_best_params,
-                    best_mr.get('Max_Drawdown'), best_mom.get('Max_Drawdown')
-                )
-                insights_text += ai_analysis
-            except Exception as e:
+            analysis = None
+            if ai_analysis is not None:
+                try:
+                    # Started by generate_full_report; failed AI requests already come back
+                    # as rule-based text, so this only sees errors raised by the worker itself
+                    analysis = ai_analysis.result()
+                except Exception as e:
+                    print(f"AI market analysis failed: {e}")
+            
+            if analysis is not None:
+                insights_text += analysis
+            else:
                 # Fallback to simple analysis
                 insights_text += f"Analysis based on backtest results:\n"
                 if winning_strategy == "Mean Reversion":
@@ -499,16 +788,16 @@ class StrategyReportGenerator:
                     insights_text += f"• Trend-following approach was more successful"
         
         # Clean up formatting and display text
-        clean_text = insights_text.replace('**', '')  # Remove markdown bold markers
+        clean_text = _core_font_text(insights_text.replace('**', ''))  # Remove markdown bold markers
         ax.text(0.1, 0.85, clean_text, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', fontfamily='serif', wrap=True)
         
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        pdf.savefig(fig)
     
     def _create_glossary_page(self, pdf):
         """Create comprehensive glossary page with finance terms and formulas."""
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 format
+        fig = pdf.figure()  # A4 format
+        ax = fig.subplots()
         ax.axis('off')
         
         # Title
@@ -579,8 +868,7 @@ Buy/Sell Signals
         ax.text(0.1, 0.85, glossary_text, transform=ax.transAxes, fontsize=9,
                 verticalalignment='top', fontfamily='serif')
         
-        pdf.savefig(fig, dpi=150)
-        plt.close(fig)
+        pdf.savefig(fig)
     
 
 
@@ -604,14 +892,65 @@ def prompt_for_report_generation(report_type, results=None, mr_results=None, mom
             
             print(f"PDF report generated: {filename}")
             
-            # Check if file was created and show file size
-            if os.path.exists(filename):
-                file_size = os.path.getsize(filename) / 1024  # Size in KB
-                print(f"Report saved successfully ({file_size:.1f} KB)")
-            else:
+            # Check if file was created and show file size (one stat call)
+            try:
+                file_size = os.stat(filename).st_size / 1024  # Size in KB
+            except FileNotFoundError:
                 print("ERROR: Report file was not created")
+            else:
+                print(f"Report saved successfully ({file_size:.1f} KB)")
                 
     except (EOFError, KeyboardInterrupt):
         print("\nSkipping report generation.")
     except Exception as e:
-        print(f"ERROR generating report: {e}")
\ No newline at end of file
+        print(f"ERROR generating report: {e}")
+
+# Report kinds accepted by generate_reports_parallel and the generator method that builds each
+_REPORT_KINDS = {
+    'basic': 'generate_basic_report',
+    'full': 'generate_full_report',
+}
+
+
+def _generate_report_job(job):
+    """Build one report in a worker process; see generate_reports_parallel."""
+    arguments = {key: value for key, value in job.items() if key not in ('kind', 'ticker')}
+    report_gen = StrategyReportGenerator(job['ticker'])
+    return getattr(report_gen, _REPORT_KINDS[job['kind']])(**arguments)
+
+
+def generate_reports_parallel(jobs, workers=None):
+    """
+    Generate reports for several tickers in separate processes.
+    
+    Parameters:
+    - jobs: List of dicts, each with 'kind' ('basic' or 'full'), 'ticker', a 'filename' and
+      the keyword arguments of the matching method: 'results' for generate_basic_report, or
+      'mr_results', 'mom_results', 'mr_best_params', 'mom_best_params' for generate_full_report
+    - workers: Number of worker processes (default: os.cpu_count())
+    
+    Returns:
+    - List of generated filenames, in the same order as jobs
+    """
+    # Default filenames only have a seconds-resolution timestamp, so concurrent jobs for
+    # the same ticker could overwrite each other; every job must name its own file
+    filenames = set()
+    for job in jobs:
+        if job.get('kind') not in _REPORT_KINDS:
+            raise ValueError(f"Unknown report kind {job.get('kind')!r}; expected one of {sorted(_REPORT_KINDS)}")
+        filename = job.get('filename')
+        if not filename:
+            raise ValueError(f"Report job for {job.get('ticker')} needs a filename")
+        if os.path.abspath(filename) in filenames:
+            raise ValueError(f"Report filename {filename} is used by more than one job")
+        filenames.add(os.path.abspath(filename))
+    
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    
+    # Spawned workers start from a clean interpreter instead of forking a parent that
+    # may already hold matplotlib state; the context is local, so the caller's
+    # global start method is left alone
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(_generate_report_job, jobs))
@@ -1,63 +1,106 @@
 # Simple Momentum Strategy: Calculate the rolling mean of the closing price and use it to generate buy and sell signals.
-import yfinance as yf
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
+
+def shifted_rolling_mean(close_cumsum, window):
+    # Mean of the previous `window` closes at each row (NaN until a full window exists), i.e.
+    # rolling(window).mean().shift(1), from prefix sums close_cumsum = [0, c0, c0 + c1, ...]
+    means = np.full(len(close_cumsum) - 1, np.nan)
+    means[window:] = (close_cumsum[window:-1] - close_cumsum[:-window - 1]) / window
+    return means
+
+
+def close_prefix_sums(close_series):
+    # Prefix sums [0, c0, c0 + c1, ...] of the close; one array serves shifted_rolling_mean for every window
+    return np.concatenate(([0.0], np.cumsum(close_series.to_numpy(dtype=np.float64))))
+
+
+def shifted_rolling_mean_series(close_series, window, close_cumsum=None):
+    # rolling(window).mean().shift(1) as a Series, from prefix sums (close_cumsum, or computed here)
+    # when the close has no gaps; windows spanning a NaN must stay NaN, so gappy data keeps pandas rolling
+    if close_series.hasnans:
+        return close_series.rolling(window=window).mean().shift(1)
+    if close_cumsum is None:
+        close_cumsum = close_prefix_sums(close_series)
+    return pd.Series(shifted_rolling_mean(close_cumsum, window), index=close_series.index)
+
+
+def _position_changes(signal):
+    # Signal.diff() as int8, with 0 (no change) on the first row instead of NaN
+    signal = np.asarray(signal, dtype=np.int8)
+    position = np.zeros_like(signal)
+    np.subtract(signal[1:], signal[:-1], out=position[1:])
+    return position
 
-def simple_momentum_strategy(data, window=20, ticker='TSLA'):
-    # Create a copy to avoid modifying the original data
-    data = data.copy()
-    
-    # Handle MultiIndex columns from yfinance
-    if isinstance(data.columns, pd.MultiIndex):
-        # Flatten the column names
-        data.columns = [col[0] if col[1] == '' else f"{col[0]}_{col[1]}" for col in data.columns]
 
-    # Ensure standardized close column exists
-    if f'Close_{ticker}' not in data.columns:
+def simple_momentum_strategy(data, window=20, ticker='TSLA', rolling_mean=None):
+    # rolling_mean: optional precomputed shifted rolling mean of the close for this window
+    # Resolve the standardized close column (data_loader.normalize_data_columns has
+    # already flattened yfinance's MultiIndex columns)
+    close_col = f'Close_{ticker}'
+    if close_col not in data.columns:
         if 'Close' in data.columns:
-            data[f'Close_{ticker}'] = data['Close']
+            close_col = 'Close'
         elif f'{ticker}_Close' in data.columns:
-            data[f'Close_{ticker}'] = data[f'{ticker}_Close']
+            close_col = f'{ticker}_Close'
 
-    close_series = data[f'Close_{ticker}'] if isinstance(data[f'Close_{ticker}'], pd.Series) else data[f'Close_{ticker}'].squeeze()
+    close_series = data[close_col] if isinstance(data[close_col], pd.Series) else data[close_col].squeeze()
 
-    # compute shifted rolling mean
-    data['RollingMean'] = close_series.rolling(window=window).mean().shift(1) 
-    # drop all rows where RollingMean is NaN.
-    data = data.dropna(subset=['RollingMean'])
-    data['Signal']   = (data[f'Close_{ticker}'] > data['RollingMean']).astype(int)
-    data['Position'] = data['Signal'].diff()
+    # Work on a new frame holding only the close; the other OHLCV columns are never read,
+    # so the input is left untouched without copying it whole
+    data = pd.DataFrame({f'Close_{ticker}': close_series})
+
+    # compute shifted rolling mean (unless the caller already has it)
+    if rolling_mean is None:
+        rolling_mean = shifted_rolling_mean_series(close_series, window)
+    # drop all rows where RollingMean is NaN, then derive Signal/Position from the
+    # remaining arrays in one assign instead of column-by-column setitems.
+    valid = rolling_mean.notna().to_numpy()
+    data = data[valid]
+    rolling_values = rolling_mean.to_numpy()[valid]
+    signal = (close_series.to_numpy()[valid] > rolling_values).astype(np.int8)
+    data = data.assign(RollingMean=rolling_values, Signal=signal, Position=_position_changes(signal))
 
     return data
 
 
-def mean_reversion_strategy(data, window=20, threshold=0.02, ticker='TSLA'):
-    # Create a copy to avoid modifying the original data
-    data = data.copy()
-    
-    # Handle MultiIndex columns from yfinance
-    if isinstance(data.columns, pd.MultiIndex):
-        # Flatten the column names
-        data.columns = [col[0] if col[1] == '' else f"{col[0]}_{col[1]}" for col in data.columns]
+def mean_reversion_signals(close, rolling_mean, thresholds):
+    # Signals for several thresholds in one broadcast pass: returns a (len(thresholds), len(close))
+    # int8 array with 1 below the lower band, -1 above the upper band and 0 otherwise (or no mean yet)
+    close = np.asarray(close, dtype=np.float64)
+    rolling_mean = np.asarray(rolling_mean, dtype=np.float64)
+    thresholds = np.asarray(thresholds, dtype=np.float64)[:, np.newaxis]
+    return np.where(close < rolling_mean * (1 - thresholds), 1,
+                    np.where(close > rolling_mean * (1 + thresholds), -1, 0)).astype(np.int8)
 
-    # Ensure standardized close column exists
-    if f'Close_{ticker}' not in data.columns:
+
+def mean_reversion_strategy(data, window=20, threshold=0.02, ticker='TSLA', rolling_mean=None, signal=None):
+    # rolling_mean: optional precomputed shifted rolling mean of the close for this window
+    # signal: optional precomputed Signal values for this window/threshold (see mean_reversion_signals)
+    # Resolve the standardized close column (data_loader.normalize_data_columns has
+    # already flattened yfinance's MultiIndex columns)
+    close_col = f'Close_{ticker}'
+    if close_col not in data.columns:
         if 'Close' in data.columns:
-            data[f'Close_{ticker}'] = data['Close']
+            close_col = 'Close'
         elif f'{ticker}_Close' in data.columns:
-            data[f'Close_{ticker}'] = data[f'{ticker}_Close']
+            close_col = f'{ticker}_Close'
+
+    close_series = data[close_col] if isinstance(data[close_col], pd.Series) else data[close_col].squeeze()
+
+    # Work on a new frame holding only the close; the other OHLCV columns are never read,
+    # so the input is left untouched without copying it whole
+    data = pd.DataFrame({f'Close_{ticker}': close_series})
 
-    close_series = data[f'Close_{ticker}'] if isinstance(data[f'Close_{ticker}'], pd.Series) else data[f'Close_{ticker}'].squeeze()
-    
     # Pure mean-reversion strategy bands
-    data['RollingMean'] = close_series.rolling(window=window).mean().shift(1)
-    lower_band =  data['RollingMean'] * (1 - threshold)
-    upper_band =  data['RollingMean'] * (1 + threshold)
-
-    # Signals and positions
-    data['Signal'] = pd.Series(0, index=data.index, dtype=int)
-    data.loc[data[f'Close_{ticker}'] < lower_band, 'Signal'] = 1
-    data.loc[data[f'Close_{ticker}'] > upper_band, 'Signal'] = -1
-    data['Position'] = data['Signal'].diff()
+    if rolling_mean is None:
+        rolling_mean = shifted_rolling_mean_series(close_series, window)
+    data['RollingMean'] = rolling_mean
+
+    # Signals and positions: one np.where pass over the arrays rather than chained .loc setitems
+    if signal is None:
+        signal = mean_reversion_signals(close_series, rolling_mean, [threshold])[0]
+    data['Signal'] = signal
+    data['Position'] = _position_changes(signal)
     
     return data
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Check the on-disk download cache of data_loader (yfinance is replaced, no network access).
+Usage:
+  python -m pytest tests/test_data_loader.py
+"""
+import os
+import pickle
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_loader
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replace yf.download with a fake that records its calls."""
+    calls = []
+
+    def download(ticker, *args, **kwargs):
+        calls.append(ticker)
+        return pd.DataFrame({'Close': np.arange(5.0)}, index=pd.bdate_range('2020-01-01', periods=5))
+
+    monkeypatch.setattr(data_loader.yf, 'download', download)
+    return calls
+
+
+def _cache_file(cache_dir):
+    return os.path.join(cache_dir, 'TST_2020-01-01_2020-02-01.pkl')
+
+
+def _load(cache_dir):
+    return data_loader.download_ticker_data('TST', '2020-01-01', '2020-02-01', cache_dir=str(cache_dir))
+
+
+def test_second_call_reads_the_cache(downloads, tmp_path):
+    first = _load(tmp_path)
+    second = _load(tmp_path)
+    assert downloads == ['TST']
+    assert first.equals(second)
+
+
+@pytest.mark.parametrize('content', [
+    pytest.param(b'not a pickle', id='garbage'),
+    pytest.param(pickle.dumps(pd.DataFrame({'Close': [1.0]}))[:20], id='truncated'),
+    # Unpickling imports a module that does not exist, like a pickle from another code base
+    pytest.param(b'cno_such_module\nThing\n(tR.', id='missing-module'),
+    pytest.param(pickle.dumps(['not', 'a', 'frame']), id='not-a-dataframe'),
+    pytest.param(pickle.dumps(pd.DataFrame()), id='empty-dataframe'),
+])
+def test_unusable_cache_file_falls_back_to_download(downloads, tmp_path, content):
+    with open(_cache_file(tmp_path), 'wb') as cache_file:
+        cache_file.write(content)
+
+    data = _load(tmp_path)
+
+    assert downloads == ['TST']
+    assert len(data) == 5
+    # The bad file was replaced by the fresh download
+    assert pd.read_pickle(_cache_file(tmp_path)).equals(data)
+
+
+def test_cache_can_be_disabled(downloads, tmp_path):
+    data_loader.download_ticker_data('TST', '2020-01-01', '2020-02-01', cache_dir=None)
+    data_loader.download_ticker_data('TST', '2020-01-01', '2020-02-01', cache_dir=None)
+    assert downloads == ['TST', 'TST']
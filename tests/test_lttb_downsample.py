@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Check the Largest-Triangle-Three-Buckets downsampling used for report line charts.
+Usage:
+  python -m pytest tests/test_lttb_downsample.py
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+import report_generator
+
+# report_generator imports NumPy and matplotlib lazily
+report_generator._lazy()
+
+
+def _reference_lttb_indices(x, y, n_out):
+    """Straightforward per-bucket LTTB returning the indices of the kept points."""
+    n = len(x)
+    buckets = np.array_split(np.arange(1, n - 1), n_out - 2)
+    selected = [0]
+    a = 0
+    for i, bucket in enumerate(buckets):
+        following = buckets[i + 1] if i + 1 < len(buckets) else np.array([n - 1])
+        cx, cy = x[following].mean(), y[following].mean()
+        areas = [abs((x[a] - cx) * (y[j] - y[a]) - (x[a] - x[j]) * (cy - y[a])) for j in bucket]
+        a = bucket[int(np.argmax(areas))]
+        selected.append(a)
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+def _series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(n, dtype=np.int64) * 86_400, 100 + np.cumsum(rng.normal(0, 1, n))
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 10, 1999])
+def test_short_series_pass_through(n):
+    x, y = _series(n)
+    xs, ys = report_generator._lttb_downsample(x, y, n_out=1000)
+    np.testing.assert_array_equal(xs, x)
+    np.testing.assert_array_equal(ys, y)
+
+
+def test_tiny_target_passes_through():
+    x, y = _series(100)
+    xs, ys = report_generator._lttb_downsample(x, y, n_out=2)
+    assert len(xs) == 100
+
+
+@pytest.mark.parametrize('n, n_out', [(2000, 1000), (5000, 1000), (10_001, 500), (300, 3), (64, 10)])
+def test_length_and_endpoints(n, n_out):
+    x, y = _series(n)
+    xs, ys = report_generator._lttb_downsample(x, y, n_out=n_out)
+    assert len(xs) == len(ys) == n_out
+    assert (xs[0], ys[0]) == (x[0], y[0])
+    assert (xs[-1], ys[-1]) == (x[-1], y[-1])
+    # Kept points are a strictly increasing subsequence of the input
+    assert (np.diff(xs) > 0).all()
+    assert xs.dtype == x.dtype
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_reference_lttb(seed):
+    x, y = _series(3000, seed)
+    xs, ys = report_generator._lttb_downsample(x, y, n_out=200)
+    indices = _reference_lttb_indices(x.astype(np.float64), y, 200)
+    np.testing.assert_array_equal(xs, x[indices])
+    np.testing.assert_array_equal(ys, y[indices])
+
+
+def test_keeps_isolated_spike():
+    x, y = _series(4000)
+    y = np.zeros(4000)
+    y[1234] = 50.0
+    xs, ys = report_generator._lttb_downsample(x, y, n_out=100)
+    assert 50.0 in ys
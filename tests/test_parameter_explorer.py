@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Check ParameterExplorer's mean reversion search on synthetic prices (no network access).
+Usage:
+  python -m pytest tests/test_parameter_explorer.py
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import parameter_explorer
+
+
+def _explorer(n=400, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    data = pd.DataFrame({'Close_TST': close}, index=pd.bdate_range('2020-01-01', periods=n))
+    explorer = parameter_explorer.ParameterExplorer(data, 'TST')
+    # Pre-set the risk-free rate so no fetch is attempted
+    explorer._risk_free = (0.02, 'test')
+    return explorer
+
+
+def test_random_search_samples_inside_the_box():
+    explorer = _explorer()
+    results, best_params, best_sharpe = explorer.random_search_mean_reversion_parameters(
+        n_samples=12, window_range=(10, 50), threshold_range=(0.005, 0.05), seed=0)
+
+    assert len(results) == 12
+    windows = np.array([r['Window'] for r in results])
+    thresholds = np.array([r['Threshold'] for r in results])
+    assert ((windows >= 10) & (windows <= 50)).all()
+    assert ((thresholds >= 0.005) & (thresholds <= 0.05)).all()
+
+    # Best parameters are the sampled combination with the highest Sharpe ratio
+    best = max(results, key=lambda r: r['Sharpe_Ratio'])
+    assert best_params == (best['Window'], best['Threshold'])
+    assert best_sharpe == best['Sharpe_Ratio']
+
+
+def test_random_search_is_reproducible_with_a_seed():
+    explorer = _explorer()
+    first = explorer.random_search_mean_reversion_parameters(n_samples=6, seed=42)
+    second = explorer.random_search_mean_reversion_parameters(n_samples=6, seed=42)
+    assert first[1:] == second[1:]
+    assert [(r['Window'], r['Threshold']) for r in first[0]] == [(r['Window'], r['Threshold']) for r in second[0]]
+
+
+def test_random_search_results_match_the_grid_format():
+    explorer = _explorer()
+    grid_results, _, _ = explorer.explore_mean_reversion_parameters(windows=[10, 20], thresholds=[0.01, 0.02])
+    random_results, _, _ = explorer.random_search_mean_reversion_parameters(n_samples=4, seed=3)
+
+    for grid_result, random_result in zip(grid_results, random_results):
+        assert grid_result.keys() == random_result.keys()
+        assert type(random_result['Window']) is int
+        assert type(random_result['Threshold']) is float
+        assert list(random_result['Data'].columns) == list(grid_result['Data'].columns)
+
+    # The results feed the same tabulation helpers as the grid
+    frame = parameter_explorer.results_to_frame(random_results, ['Window', 'Threshold', 'Sharpe_Ratio', 'Max_Drawdown'])
+    assert len(frame) == 4
+
+
+def test_random_search_cell_matches_the_same_grid_cell():
+    explorer = _explorer()
+    random_results, _, _ = explorer.random_search_mean_reversion_parameters(n_samples=3, seed=7)
+    for result in random_results:
+        grid_result = explorer.explore_mean_reversion_parameters(
+            windows=[result['Window']], thresholds=[result['Threshold']])[0][0]
+        assert grid_result['Data'].equals(result['Data'])
+        assert grid_result['Sharpe_Ratio'] == result['Sharpe_Ratio']
+
+
+def test_worker_processes_match_serial_results():
+    explorer = _explorer()
+    serial = explorer.explore_mean_reversion_parameters(windows=[10, 30], thresholds=[0.01, 0.03])
+    parallel = explorer.explore_mean_reversion_parameters(windows=[10, 30], thresholds=[0.01, 0.03], max_workers=2)
+    assert serial[1:] == parallel[1:]
+    for serial_result, parallel_result in zip(serial[0], parallel[0]):
+        assert serial_result['Data'].equals(parallel_result['Data'])
+
+    serial = explorer.explore_momentum_parameters(windows=[10, 20, 30])
+    parallel = explorer.explore_momentum_parameters(windows=[10, 20, 30], max_workers=2)
+    assert serial[1:] == parallel[1:]
+    for serial_result, parallel_result in zip(serial[0], parallel[0]):
+        assert serial_result['Data'].equals(parallel_result['Data'])
+
+
+def test_progress_is_reported_as_results_arrive(capsys, monkeypatch):
+    explorer = _explorer()
+    printed = []
+    original = parameter_explorer._backtest_momentum
+
+    def backtest(*job):
+        # Record how many progress lines were printed since the previous backtest ran
+        printed.append(capsys.readouterr().out.count('Tested momentum window'))
+        return original(*job)
+
+    monkeypatch.setattr(parameter_explorer, '_backtest_momentum', backtest)
+    explorer.explore_momentum_parameters(windows=[10, 20, 30])
+    # One line per finished backtest, none printed ahead of the work
+    assert printed == [0, 1, 1]
+    assert capsys.readouterr().out.count('Tested momentum window') == 1
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Check generate_reports_parallel on synthetic results (no network access).
+Usage:
+  python -m pytest tests/test_report_jobs.py
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import parameter_explorer
+import report_generator
+
+
+@pytest.fixture(scope='module')
+def exploration():
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+    data = pd.DataFrame({'Close_TST': close}, index=pd.bdate_range('2020-01-01', periods=300))
+    explorer = parameter_explorer.ParameterExplorer(data, 'TST')
+    # Pre-set the risk-free rate so no fetch is attempted
+    explorer._risk_free = (0.02, 'test')
+    mr_results, mr_best_params, _ = explorer.explore_mean_reversion_parameters()
+    mom_results, mom_best_params, _ = explorer.explore_momentum_parameters()
+    return {
+        'basic': explorer.run_basic_strategy_comparison(),
+        'full': dict(mr_results=mr_results, mom_results=mom_results,
+                     mr_best_params=mr_best_params, mom_best_params=mom_best_params),
+    }
+
+
+def test_jobs_for_the_same_ticker_write_separate_files(exploration, tmp_path, monkeypatch):
+    # Without API keys the insights page uses the rule-based text instead of calling Gemini
+    monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+    monkeypatch.delenv('GOOGLE_API_KEY', raising=False)
+    jobs = [
+        {'kind': 'basic', 'ticker': 'TST', 'filename': str(tmp_path / 'basic_1.pdf'), 'results': exploration['basic']},
+        {'kind': 'full', 'ticker': 'TST', 'filename': str(tmp_path / 'full.pdf'), **exploration['full']},
+        {'kind': 'basic', 'ticker': 'TST', 'filename': str(tmp_path / 'basic_2.pdf'), 'results': exploration['basic']},
+    ]
+
+    filenames = report_generator.generate_reports_parallel(jobs, workers=2)
+
+    assert filenames == [job['filename'] for job in jobs]
+    for filename in filenames:
+        with open(filename, 'rb') as report:
+            assert report.read(5) == b'%PDF-'
+    # The full report has more pages than the basic one
+    assert os.path.getsize(filenames[1]) > os.path.getsize(filenames[0])
+
+
+@pytest.mark.parametrize('jobs, message', [
+    ([{'kind': 'summary', 'ticker': 'TST', 'filename': 'a.pdf', 'results': {}}], 'Unknown report kind'),
+    ([{'ticker': 'TST', 'filename': 'a.pdf', 'results': {}}], 'Unknown report kind'),
+    ([{'kind': 'basic', 'ticker': 'TST', 'results': {}}], 'needs a filename'),
+    ([{'kind': 'basic', 'ticker': 'TST', 'filename': 'a.pdf', 'results': {}},
+      {'kind': 'basic', 'ticker': 'TST', 'filename': './a.pdf', 'results': {}}], 'more than one job'),
+])
+def test_invalid_jobs_are_rejected_before_any_work(jobs, message):
+    with pytest.raises(ValueError, match=message):
+        report_generator.generate_reports_parallel(jobs, workers=1)
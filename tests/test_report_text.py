@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Check that AI text is made printable with the core PDF fonts used by the matplotlib report.
+Usage:
+  python -m pytest tests/test_report_text.py
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import report_generator
+
+
+def test_core_font_text_is_cp1252():
+    text = report_generator._core_font_text('Volatility σ ≈ 2% → trend ↑ 🚀️ Ω')
+    text.encode('cp1252')
+    assert text == 'Volatility sigma ~ 2% -> trend up  '
+
+
+def test_core_font_text_keeps_cp1252_text():
+    text = '• Café “quotes” — 5€ naïve'
+    assert report_generator._core_font_text(text) == text
+
+
+def test_core_font_text_strips_accents_outside_cp1252():
+    assert report_generator._core_font_text('Dvořák, Kraków, Iași') == 'Dvorák, Kraków, Iasi'
+
+
+def test_core_font_text_keeps_cp1252_symbols():
+    # NFKC would turn these into '12', '2' and 'mu' even though the core fonts have them
+    text = 'Allocate ½ (¼ each), volatility² and µ = 1.5%'
+    assert report_generator._core_font_text(text) == text
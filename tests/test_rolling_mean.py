@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Check the prefix-sum rolling means against pandas rolling().mean().shift(1).
+Usage:
+  python -m pytest tests/test_rolling_mean.py
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import parameter_explorer
+import strategies
+
+
+def _close(n, seed=0):
+    rng = np.random.default_rng(seed)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.Series(values, index=pd.bdate_range('2020-01-01', periods=n))
+
+
+def _assert_matches_pandas(actual, close, window):
+    expected = close.rolling(window=window).mean().shift(1)
+    assert actual.index.equals(expected.index)
+    # NaN exactly where pandas has NaN, values equal up to cumsum rounding
+    np.testing.assert_array_equal(actual.isna().to_numpy(), expected.isna().to_numpy())
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize('n', [0, 1, 5, 30, 2000])
+@pytest.mark.parametrize('window', [1, 10, 30, 50])
+def test_shifted_rolling_mean_series_matches_pandas(n, window):
+    close = _close(n)
+    _assert_matches_pandas(strategies.shifted_rolling_mean_series(close, window), close, window)
+
+
+@pytest.mark.parametrize('window', [1, 10, 30])
+def test_shifted_rolling_mean_series_keeps_gaps(window):
+    close = _close(200)
+    close.iloc[[0, 57, 120, 121]] = np.nan
+    _assert_matches_pandas(strategies.shifted_rolling_mean_series(close, window), close, window)
+
+
+def test_shared_prefix_sums_serve_every_window():
+    close = _close(500)
+    close_cumsum = strategies.close_prefix_sums(close)
+    for window in (10, 20, 30, 50):
+        _assert_matches_pandas(strategies.shifted_rolling_mean_series(close, window, close_cumsum), close, window)
+
+
+def test_explorer_rolling_mean_matches_pandas():
+    close = _close(300)
+    explorer = parameter_explorer.ParameterExplorer(pd.DataFrame({'Close_TST': close}), 'TST')
+    for window in (10, 20, 30, 50):
+        _assert_matches_pandas(explorer._rolling_mean(window), close, window)
+    assert explorer._rolling_mean(10) is explorer._rolling_mean(10)
+
+
+def test_explorer_rolling_mean_without_close_column():
+    explorer = parameter_explorer.ParameterExplorer(pd.DataFrame({'Open_TST': [1.0, 2.0]}), 'TST')
+    assert explorer._rolling_mean(10) is None
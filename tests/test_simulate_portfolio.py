@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Check the vectorized portfolio simulation against the original row-by-row loop.
+Usage:
+  python -m pytest tests/test_simulate_portfolio.py
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import finance_utils
+
+
+def _reference_portfolio_values(data, ticker, initial_cash=100):
+    """The iterrows long/flat loop simulate_portfolio used before vectorization."""
+    cash = initial_cash
+    position = 0
+    in_market = False
+    portfolio_values = []
+
+    for idx, row in data.iterrows():
+        price = row[f'Close_{ticker}']
+        signal = row['Position']
+
+        if not in_market:
+            if signal == 1:
+                position = cash / price
+                cash = 0
+                in_market = True
+        else:
+            if signal == 1:
+                pass  # Already in market
+            elif signal == -1:
+                cash = position * price
+                position = 0
+                in_market = False
+
+        portfolio_value = cash + (position * price)
+        portfolio_values.append(portfolio_value)
+
+    return np.array(portfolio_values, dtype=np.float64)
+
+
+def _frame(position, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(position))))
+    return pd.DataFrame({'Close_TST': close, 'Position': np.asarray(position, dtype=np.float64)},
+                        index=pd.bdate_range('2020-01-01', periods=len(position)))
+
+
+def _assert_matches_reference(data):
+    result = finance_utils.simulate_portfolio(data, 'test', ticker='TST')
+    np.testing.assert_array_equal(result['PortfolioValue'].to_numpy(), _reference_portfolio_values(data, 'TST'))
+
+
+nan = np.nan
+
+@pytest.mark.parametrize('position', [
+    pytest.param([0, 0, 0, 0, 0], id='no-trades'),
+    pytest.param([nan, 0, 0, 0], id='nan-only'),
+    pytest.param([0, 1, 0, 0, 0], id='buy-never-sold'),
+    pytest.param([1, 0, 0, 0], id='buy-on-first-row'),
+    pytest.param([0, -1, 0, 0, 1, 0, -1, 0], id='sell-before-any-buy'),
+    pytest.param([nan, 2, -2, 1, 2, -2, 0], id='plus-minus-two-are-holds'),
+    pytest.param([nan, 1, nan, -1, nan, 1, nan], id='nan-between-trades'),
+    pytest.param([0, 1, -1, 1, -1, 1, -1, 0], id='back-to-back-trades'),
+    pytest.param([1, -1, 1, -1], id='trade-every-row'),
+    pytest.param([0, 1, 1, 1, -1, -1, -1, 1], id='repeated-signals'),
+    pytest.param([0, 0, 0, 1, 0, 0, -1], id='sell-on-last-row'),
+    pytest.param([], id='empty'),
+])
+def test_simulate_portfolio_matches_reference(position):
+    _assert_matches_reference(_frame(position))
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_simulate_portfolio_matches_reference_on_random_signals(seed):
+    rng = np.random.default_rng(seed)
+    position = rng.choice([0, 0, 0, 1, -1, 2, -2, nan], size=250)
+    _assert_matches_reference(_frame(position, seed))
+
+
+def test_simulate_portfolio_leaves_input_untouched():
+    data = _frame([0, 1, 0, -1])
+    before = data.copy()
+    finance_utils.simulate_portfolio(data, 'test', ticker='TST')
+    assert data.equals(before)